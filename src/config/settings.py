@@ -20,6 +20,9 @@ class Settings:
     # API settings
     API_PREFIX = "/api/v1"
     
+    # Cache settings (empty uses an in-process cache)
+    REDIS_URL = os.getenv("REDIS_URL", "")
+    
     # EVM settings
     EVM_DEFAULT_THRESHOLD = float(os.getenv("EVM_DEFAULT_THRESHOLD", "0.1"))  # 10% threshold for variances
     
@@ -10,6 +10,7 @@ import pandas as pd
 import pyodbc
 import requests
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -65,6 +66,11 @@ class PrimaveraConnector:
         with open(config_path, 'r') as f:
             return json.load(f)
     
+    @property
+    def is_connected(self):
+        """Whether a connection is established (file-based access needs none)."""
+        return self.connection_type == 'file' or self.connection is not None
+    
     def connect(self):
         """Establish connection to Primavera P6 based on connection type."""
         if self.connection_type == 'api':
@@ -265,7 +271,48 @@ class PrimaveraConnector:
         elif self.connection_type == 'database':
             return self._get_activities_database(project_id)
         elif self.connection_type == 'file':
-            return self._get_activities_file(project_id)
+            return self._get_activities_file([project_id])
+    
+    def get_activities_bulk(self, project_ids):
+        """Retrieve activities for several projects at once.
+        
+        Database and file connections fetch all projects in a single query or file
+        pass. The REST API only serves activities per project, so those requests
+        are issued concurrently.
+        
+        Args:
+            project_ids (list): Project IDs to retrieve activities for
+            
+        Returns:
+            list: Activity dictionaries, each tagged with its 'proj_id'
+        """
+        project_ids = [project_id for project_id in project_ids if project_id]
+        if not project_ids:
+            return []
+        
+        if self.connection_type == 'api':
+            return self._get_activities_bulk_api(project_ids)
+        elif self.connection_type == 'database':
+            return self._get_activities_bulk_database(project_ids)
+        elif self.connection_type == 'file':
+            return self._get_activities_file(project_ids)
+    
+    def _get_activities_bulk_api(self, project_ids):
+        """Get activities for several projects using concurrent REST API requests."""
+        if not self.connection:
+            if not self.connect():
+                return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(project_ids))) as executor:
+            results = executor.map(self._get_activities_api, project_ids)
+            
+            activities = []
+            for project_id, project_activities in zip(project_ids, results):
+                for activity in project_activities:
+                    activity.setdefault('proj_id', project_id)
+                    activities.append(activity)
+        
+        return activities
     
     def _get_activities_api(self, project_id):
         """Get activities using REST API."""
@@ -313,8 +360,45 @@ class PrimaveraConnector:
             print(f"Database query error: {str(e)}")
             return []
     
-    def _get_activities_file(self, project_id):
-        """Get activities from XER/XML file for a specific project."""
+    def _get_activities_bulk_database(self, project_ids):
+        """Get activities for several projects with one query per 1000 project IDs.
+        
+        If a batch query fails, that batch is retried one project at a time so
+        only the projects that actually fail lose their activities.
+        """
+        if not self.connection:
+            if not self.connect():
+                return []
+        
+        activities = []
+        
+        # Oracle accepts at most 1000 expressions in an IN list
+        for start in range(0, len(project_ids), 1000):
+            batch = project_ids[start:start + 1000]
+            placeholders = ', '.join(['?'] * len(batch))
+            try:
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    f"""SELECT proj_id, task_id, task_code, task_name, target_start_date, target_end_date, 
+                              act_start_date, act_end_date, target_drtn_hr_cnt, remain_drtn_hr_cnt
+                       FROM task
+                       WHERE proj_id IN ({placeholders})""",
+                    batch
+                )
+                
+                columns = [column[0] for column in cursor.description]
+                activities.extend(dict(zip(columns, row)) for row in cursor.fetchall())
+            except Exception as e:
+                print(f"Database query error for batch of {len(batch)} projects, retrying per project: {str(e)}")
+                for project_id in batch:
+                    for activity in self._get_activities_database(project_id):
+                        activity['proj_id'] = project_id
+                        activities.append(activity)
+        
+        return activities
+    
+    def _get_activities_file(self, project_ids):
+        """Get activities from XER/XML file for the given projects."""
         import_dir = Path(self.config['file']['import_dir'])
         if not import_dir.exists():
             print(f"Import directory does not exist: {import_dir}")
@@ -328,13 +412,14 @@ class PrimaveraConnector:
         
         latest_file = max(files, key=lambda p: p.stat().st_mtime)
         
+        project_ids = set(project_ids)
         if latest_file.suffix.lower() == '.xer':
-            return self._parse_xer_activities(latest_file, project_id)
+            return self._parse_xer_activities(latest_file, project_ids)
         else:  # .xml
-            return self._parse_xml_activities(latest_file, project_id)
+            return self._parse_xml_activities(latest_file, project_ids)
     
-    def _parse_xer_activities(self, file_path, project_id):
-        """Parse activities from XER file for a specific project."""
+    def _parse_xer_activities(self, file_path, project_ids):
+        """Parse activities from XER file for a set of projects."""
         activities = []
         
         try:
@@ -353,9 +438,10 @@ class PrimaveraConnector:
                         values = line.split('\t')
                         activity_data = dict(zip(headers, values))
                         
-                        # Check if activity belongs to the specified project
-                        if activity_data.get('proj_id') == project_id:
+                        # Check if activity belongs to one of the specified projects
+                        if activity_data.get('proj_id') in project_ids:
                             activities.append({
+                                'proj_id': activity_data['proj_id'],
                                 'task_id': activity_data.get('task_id', ''),
                                 'task_code': activity_data.get('task_code', ''),
                                 'task_name': activity_data.get('task_name', ''),
@@ -372,32 +458,34 @@ class PrimaveraConnector:
             print(f"Error parsing XER activities: {str(e)}")
             return []
     
-    def _parse_xml_activities(self, file_path, project_id):
-        """Parse activities from XML file for a specific project."""
+    def _parse_xml_activities(self, file_path, project_ids):
+        """Parse activities from XML file for a set of projects."""
         activities = []
         
         try:
             tree = ET.parse(file_path)
             root = tree.getroot()
             
-            # Find the specified project
-            project = root.find(f".//Project[@ID='{project_id}']")
-            if project is None:
-                return []
-            
-            # Get activities for the project
-            for activity in project.findall('./Activity'):
-                activities.append({
-                    'task_id': activity.get('ID', ''),
-                    'task_code': activity.get('Code', ''),
-                    'task_name': activity.get('Name', ''),
-                    'target_start_date': activity.get('PlannedStartDate', ''),
-                    'target_end_date': activity.get('PlannedFinishDate', ''),
-                    'act_start_date': activity.get('ActualStartDate', ''),
-                    'act_end_date': activity.get('ActualFinishDate', ''),
-                    'target_duration': activity.get('PlannedDuration', ''),
-                    'remain_duration': activity.get('RemainingDuration', '')
-                })
+            # Find the specified projects
+            for project in root.iter('Project'):
+                project_id = project.get('ID')
+                if project_id not in project_ids:
+                    continue
+                
+                # Get activities for the project
+                for activity in project.findall('./Activity'):
+                    activities.append({
+                        'proj_id': project_id,
+                        'task_id': activity.get('ID', ''),
+                        'task_code': activity.get('Code', ''),
+                        'task_name': activity.get('Name', ''),
+                        'target_start_date': activity.get('PlannedStartDate', ''),
+                        'target_end_date': activity.get('PlannedFinishDate', ''),
+                        'act_start_date': activity.get('ActualStartDate', ''),
+                        'act_end_date': activity.get('ActualFinishDate', ''),
+                        'target_duration': activity.get('PlannedDuration', ''),
+                        'remain_duration': activity.get('RemainingDuration', '')
+                    })
             
             return activities
         except Exception as e:
@@ -7,12 +7,19 @@ facilitating efficient querying, analysis, and reporting on project data.
 import os
 import json
 import sqlite3
+import threading
 import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
 class PrimaveraDatabase:
-    """Database manager for Primavera P6 data integration with CSCSC AI Agent."""
+    """Database manager for Primavera P6 data integration with CSCSC AI Agent.
+    
+    Each thread gets its own SQLite connection, opened on first use and reused
+    by later calls from that thread, so one instance can be shared by request
+    handlers running in a thread pool.
+    """
     
     def __init__(self, db_path=None):
         """Initialize the Primavera database.
@@ -29,7 +36,7 @@ class PrimaveraDatabase:
         # Ensure parent directory exists
         os.makedirs(self.db_path.parent, exist_ok=True)
         
-        self.connection = None
+        self._local = threading.local()
         self.initialize_database()
     
     def initialize_database(self):
@@ -141,20 +148,54 @@ class PrimaveraDatabase:
         self.connection.commit()
         self.disconnect()
     
+    @property
+    def connection(self):
+        """The calling thread's database connection, or None if not connected."""
+        return getattr(self._local, 'connection', None)
+    
     def connect(self):
-        """Establish database connection."""
+        """Establish the calling thread's database connection if not already open."""
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            connection = sqlite3.connect(self.db_path, timeout=30)
             # Enable foreign key support
-            self.connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA foreign_keys = ON")
+            # Let readers proceed while another thread writes
+            connection.execute("PRAGMA journal_mode = WAL")
             # Return dictionary-like rows
-            self.connection.row_factory = sqlite3.Row
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
             
     def disconnect(self):
-        """Close database connection."""
+        """Close the calling thread's database connection."""
         if self.connection:
             self.connection.close()
-            self.connection = None
+            self._local.connection = None
+    
+    @contextmanager
+    def transaction(self):
+        """Group several store calls into one transaction on the calling thread.
+        
+        Store methods called inside the block skip their own commit; the block
+        commits once when it completes and rolls back if it raises.
+        
+        Yields:
+            PrimaveraDatabase: This database
+        """
+        self.connect()
+        self._local.in_transaction = True
+        try:
+            yield self
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            self._local.in_transaction = False
+    
+    def _commit(self):
+        """Commit the calling thread's connection unless a transaction block is open."""
+        if not getattr(self._local, 'in_transaction', False):
+            self.connection.commit()
     
     def store_projects(self, projects):
         """Store project data in the database.
@@ -218,8 +259,7 @@ class PrimaveraDatabase:
             
             count += 1
         
-        self.connection.commit()
-        self.disconnect()
+        self._commit()
         return count
     
     def store_activities(self, activities):
@@ -249,23 +289,7 @@ class PrimaveraDatabase:
             exists = cursor.fetchone() is not None
             
             # Prepare data
-            activity_data = {
-                'task_id': task_id,
-                'proj_id': activity.get('proj_id', ''),
-                'task_code': activity.get('task_code', ''),
-                'task_name': activity.get('task_name', ''),
-                'target_start_date': activity.get('target_start_date', ''),
-                'target_end_date': activity.get('target_end_date', ''),
-                'act_start_date': activity.get('act_start_date', ''),
-                'act_end_date': activity.get('act_end_date', ''),
-                'target_duration': activity.get('target_duration', 0),
-                'remain_duration': activity.get('remain_duration', 0),
-                'progress': activity.get('progress', 0)
-            }
-            
-            # Store additional fields as JSON in metadata
-            metadata = {k: v for k, v in activity.items() if k not in activity_data}
-            activity_data['metadata'] = json.dumps(metadata) if metadata else None
+            activity_data = self._prepare_activity_data(activity)
             
             if exists:
                 # Update existing activity
@@ -286,9 +310,66 @@ class PrimaveraDatabase:
             
             count += 1
         
-        self.connection.commit()
-        self.disconnect()
+        self._commit()
         return count
+    
+    def store_activities_bulk(self, activities):
+        """Store activity data for any number of projects in one statement batch.
+        
+        Rows are upserted with a single executemany call and committed once,
+        instead of an existence check plus insert or update per activity.
+        
+        Args:
+            activities (list): List of activity dictionaries
+        
+        Returns:
+            int: Number of activities stored
+        """
+        rows = [self._prepare_activity_data(activity) for activity in activities if activity.get('task_id')]
+        if not rows:
+            return 0
+        
+        columns = list(rows[0].keys())
+        placeholders = ', '.join(['?'] * len(columns))
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column != 'task_id')
+        
+        self.connect()
+        self.connection.executemany(
+            f"INSERT INTO activities ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(task_id) DO UPDATE SET {updates}",
+            [list(row.values()) for row in rows]
+        )
+        self._commit()
+        return len(rows)
+    
+    def _prepare_activity_data(self, activity):
+        """Map an activity dictionary onto the activities table columns.
+        
+        Args:
+            activity (dict): Activity dictionary with a 'task_id'
+        
+        Returns:
+            dict: Column values, with unknown fields stored as JSON in 'metadata'
+        """
+        activity_data = {
+            'task_id': activity.get('task_id'),
+            'proj_id': activity.get('proj_id', ''),
+            'task_code': activity.get('task_code', ''),
+            'task_name': activity.get('task_name', ''),
+            'target_start_date': activity.get('target_start_date', ''),
+            'target_end_date': activity.get('target_end_date', ''),
+            'act_start_date': activity.get('act_start_date', ''),
+            'act_end_date': activity.get('act_end_date', ''),
+            'target_duration': activity.get('target_duration', 0),
+            'remain_duration': activity.get('remain_duration', 0),
+            'progress': activity.get('progress', 0)
+        }
+        
+        # Store additional fields as JSON in metadata
+        metadata = {k: v for k, v in activity.items() if k not in activity_data}
+        activity_data['metadata'] = json.dumps(metadata) if metadata else None
+        
+        return activity_data
         
     def store_import_log(self, import_type, source, status, message=None, metadata=None):
         """Log an import operation.
@@ -324,8 +405,7 @@ class PrimaveraDatabase:
         )
         
         import_id = cursor.lastrowid
-        self.connection.commit()
-        self.disconnect()
+        self._commit()
         
         return import_id
     
@@ -361,8 +441,7 @@ class PrimaveraDatabase:
         )
         
         analysis_id = cursor.lastrowid
-        self.connection.commit()
-        self.disconnect()
+        self._commit()
         
         return analysis_id
     
@@ -399,7 +478,6 @@ class PrimaveraDatabase:
                     
             projects.append(project)
             
-        self.disconnect()
         return projects
     
     def get_activities(self, proj_id=None, task_id=None):
@@ -438,7 +516,6 @@ class PrimaveraDatabase:
                     
             activities.append(activity)
             
-        self.disconnect()
         return activities
     
     def get_ai_analysis(self, analysis_id=None, proj_id=None, analysis_type=None):
@@ -490,7 +567,6 @@ class PrimaveraDatabase:
                     
             analysis_results.append(analysis)
             
-        self.disconnect()
         return analysis_results
     
     def run_query(self, query, params=None):
@@ -516,14 +592,12 @@ class PrimaveraDatabase:
             if query.strip().upper().startswith('SELECT'):
                 results = [dict(row) for row in cursor.fetchall()]
             else:
-                self.connection.commit()
+                self._commit()
                 results = {'rowcount': cursor.rowcount}
                 
-            self.disconnect()
             return results
         except Exception as e:
             self.connection.rollback()
-            self.disconnect()
             raise e
     
     def export_to_dataframe(self, table_name, conditions=None):
@@ -551,6 +625,5 @@ class PrimaveraDatabase:
                 query += " WHERE " + " AND ".join(query_conditions)
                 
         df = pd.read_sql_query(query, self.connection, params=params)
-        self.disconnect()
         
         return df
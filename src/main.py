@@ -7,14 +7,14 @@ from src.config.settings import settings
 from src.user_interface.api_router import router as api_router
 from src.user_interface.physical_ai_router import router as physical_ai_router
 from src.user_interface.crewai_router import router as crewai_router
-from src.user_interface.primavera_router import router as primavera_router
+from src.user_interface.primavera_router import router as primavera_router, init_response_cache
 from src.user_interface.mpxj_router import mpxj_router
 from src.data_ingestion.database import Database
 from src.evm_engine.calculator import EVMCalculator
 from src.evm_engine.physical_ai_assistant import PhysicalEVMAssistant
 from src.ai_ml_analysis.analyzer import EVMAnalyzer
 from src.nlg_engine.generator import NLGGenerator
-from src.utils.helpers import save_sample_data, save_sample_physical_data
+from src.utils.helpers import save_all_sample_data
 
 # Create data directory for database if it doesn't exist
 db_dir = Path(settings.DATABASE_DIR)
@@ -62,19 +62,11 @@ async def startup_event():
     print(f"Starting AI EVM Agent on {settings.HOST}:{settings.PORT}")
     print(f"Database initialized at {os.path.join(settings.DATABASE_DIR, settings.DATABASE_FILENAME)}")
     
-    # Generate sample data files
-    sample_data_path = sample_data_dir / "sample_project.json"
-    if not sample_data_path.exists():
-        print("Generating sample project data...")
-        save_sample_data(sample_data_path)
-        print(f"Sample data saved to {sample_data_path}")
+    # Initialize response cache for polled Primavera endpoints
+    init_response_cache(settings.REDIS_URL)
     
-    # Generate sample physical data
-    physical_data_path = sample_data_dir / "sample_physical_data.json"
-    if not physical_data_path.exists():
-        print("Generating sample physical project data...")
-        save_sample_physical_data(physical_data_path)
-        print(f"Sample physical data saved to {physical_data_path}")
+    # Generate any missing sample data files, writing both concurrently
+    save_all_sample_data(sample_data_dir, overwrite=False)
 
 
 # Shutdown event
@@ -5,6 +5,16 @@ from nltk.stem import WordNetLemmatizer
 import re
 
 
+# Groups that only qualify an entity (like "project" in "project id") rather than hold its value
+_ENTITY_QUALIFIERS = frozenset([
+    "project", "proj", "task", "activity", "id", "number", "#",
+    "variance", "discrepancy", "difference", "issue",
+    "in", "as of", "on", "at", "by"
+])
+
+# EVM metric abbreviations mapped to the variance type they measure
+_VARIANCE_ALIASES = {"cv": "cost", "cpi": "cost", "sv": "schedule", "spi": "schedule"}
+
 class NLPProcessor:
     """Natural language processing module to understand user queries."""
 
@@ -43,27 +53,60 @@ class NLPProcessor:
             ]
         }
         
-        # Define entity extraction patterns
+        # Keywords of which at least one must occur for an intent's patterns to match.
+        # A single prefilter pass over the query decides which intents are worth
+        # running the full patterns for.
+        intent_keywords = {
+            "status_request": ["status", "progress", "update", "how is", "how are"],
+            "forecast_request": ["forecast", "predict", "estimate", "projected", "future",
+                                 "will", "finish date", "completion date", "how long until",
+                                 "time to complete", "expected duration"],
+            "variance_explanation": ["why", "explain", "reason", "cause", "what happened",
+                                     "what went wrong"],
+            "recommendation_request": ["recommend", "suggestion", "advise", "what should",
+                                       "how should", "what can", "how can", "how to",
+                                       "best way to", "options for", "solutions for",
+                                       "what would you", "steps to", "action items", "next steps"]
+        }
+        self._intent_bits = {intent: 1 << i for i, intent in enumerate(self.intent_patterns)}
+        self._keyword_bits = {}
+        for intent, keywords in intent_keywords.items():
+            for keyword in keywords:
+                self._keyword_bits[keyword] = self._keyword_bits.get(keyword, 0) | self._intent_bits[intent]
+        # Lookahead alternation reports overlapping keyword occurrences in one scan
+        self._keyword_prefilter = re.compile(
+            r'(?=(' + '|'.join(re.escape(kw) for kw in sorted(self._keyword_bits, key=len, reverse=True)) + r'))'
+        )
+        self._compiled_intent_patterns = {
+            intent: [re.compile(pattern) for pattern in patterns]
+            for intent, patterns in self.intent_patterns.items()
+        }
+        
+        # Define entity extraction patterns (lowercase; matched against the lowercased query)
         self.entity_patterns = {
             "project_id": [
-                r'\b(project|proj)\s*(id|number|#)?\s*[:=]?\s*([A-Za-z0-9-_]+)\b',
-                r'\b([Pp][0-9]{3,4})\b'  # Match P001, p123, etc.
+                r'\b(project|proj)\s*(id|number|#)?\s*[:=]?\s*([a-z0-9-_]+)\b',
+                r'\b(p[0-9]{3,4})\b'  # Match P001, p123, etc.
             ],
             "task_id": [
-                r'\b(task|activity)\s*(id|number|#)?\s*[:=]?\s*([A-Za-z0-9-_]+)\b',
-                r'\b([Tt][0-9]{3,4})\b'  # Match T001, t123, etc.
+                r'\b(task|activity)\s*(id|number|#)?\s*[:=]?\s*([a-z0-9-_]+)\b',
+                r'\b(t[0-9]{3,4})\b'  # Match T001, t123, etc.
             ],
             "variance_type": [
                 r'\b(cost|schedule|scope|performance)\s+(variance|discrepancy|difference|issue)\b',
                 r'\b(variance|discrepancy|difference|issue)\s+in\s+(cost|schedule|scope|performance)\b',
-                r'\b(CV|SV|CPI|SPI)\b'
+                r'\b(cv|sv|cpi|spi)\b'
             ],
             "date": [
-                r'\b(as of|on|at|by)\s+([A-Za-z]+\s+[0-9]{1,2}(?:st|nd|rd|th)?(?:,\s+[0-9]{4})?)\b',
+                r'\b(as of|on|at|by)\s+([a-z]+\s+[0-9]{1,2}(?:st|nd|rd|th)?(?:,\s+[0-9]{4})?)\b',
                 r'\b([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4})\b',
                 r'\b(today|yesterday|tomorrow|next week|last week|next month|last month)\b'
             ]
         }
+        self._compiled_entity_patterns = {
+            entity_type: [re.compile(pattern) for pattern in patterns]
+            for entity_type, patterns in self.entity_patterns.items()
+        }
 
     def _preprocess_text(self, text: str) -> List[str]:
         """Tokenize, remove stopwords, and lemmatize text.
@@ -97,19 +140,21 @@ class NLPProcessor:
         Returns:
             Tuple[str, Dict[str, Any]]: Identified intent and extracted entities
         """
+        query_lower = query.lower()
+        
         # Preprocess the query
         try:
             processed_tokens = self._preprocess_text(query)
         except Exception as e:
             # Fallback if preprocessing fails
-            processed_tokens = query.lower().split()
+            processed_tokens = query_lower.split()
             print(f"Warning: Error in preprocessing text: {e}")
         
         # Detect intent using patterns
         intent = self._detect_intent(query)
         
         # Extract entities
-        entities = self._extract_entities(query)
+        entities = self._extract_entities(query, query_lower)
         
         # Look for specific keywords to enhance entity extraction
         keywords = {
@@ -118,15 +163,15 @@ class NLPProcessor:
         }
         
         # Check for variance type if it wasn't explicitly extracted
-        if "variance_type" not in entities and any(kw in query.lower() for kw in keywords["cost"]):
+        if "variance_type" not in entities and any(kw in query_lower for kw in keywords["cost"]):
             entities["variance_type"] = "cost"
-        elif "variance_type" not in entities and any(kw in query.lower() for kw in keywords["schedule"]):
+        elif "variance_type" not in entities and any(kw in query_lower for kw in keywords["schedule"]):
             entities["variance_type"] = "schedule"
         
         # Look for project names that might not match the ID pattern
         project_names = ["construction project", "software development", "it upgrade"]
         for name in project_names:
-            if name.lower() in query.lower():
+            if name in query_lower:
                 entities["project_name"] = name
                 # Assign a default project ID if none was extracted
                 if "project_id" not in entities:
@@ -147,48 +192,59 @@ class NLPProcessor:
         # Convert to lowercase for easier matching
         query_lower = query.lower()
         
-        # Check for matches with each intent pattern
-        for intent, patterns in self.intent_patterns.items():
+        # Find which intents have at least one of their keywords in the query
+        hit_mask = 0
+        for match in self._keyword_prefilter.finditer(query_lower):
+            hit_mask |= self._keyword_bits[match.group(1)]
+        
+        # Check for matches with each candidate intent pattern
+        for intent, patterns in self._compiled_intent_patterns.items():
+            if not hit_mask & self._intent_bits[intent]:
+                continue
             for pattern in patterns:
-                if re.search(pattern, query_lower):
+                if pattern.search(query_lower):
                     return intent
         
         # Default intent if no matches found
         return "unknown"
 
-    def _extract_entities(self, query: str) -> Dict[str, Any]:
+    def _extract_entities(self, query: str, query_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract entities from a user query using pattern matching.
         
         Args:
             query: User's query
+            query_lower: Lowercased query, if the caller already has it
             
         Returns:
             Dict[str, Any]: Extracted entities
         """
         entities = {}
+        if query_lower is None:
+            query_lower = query.lower()
+        
+        # Matching runs on the lowercased query; values are sliced from the original
+        # query so IDs keep their case (unless lowercasing changed the length)
+        same_length = len(query_lower) == len(query)
         
         # Check for each entity type
-        for entity_type, patterns in self.entity_patterns.items():
+        for entity_type, patterns in self._compiled_entity_patterns.items():
             for pattern in patterns:
-                matches = re.search(pattern, query, re.IGNORECASE)
+                matches = pattern.search(query_lower)
                 if matches:
                     # Different patterns may have the entity in different groups
                     entity_value = None
                     for i in range(1, len(matches.groups()) + 1):
-                        # Skip groups that are just qualifiers (like "project" in "project id")
-                        if matches.group(i) not in ["project", "proj", "task", "activity", "id", "number", "#", 
-                                                 "variance", "discrepancy", "difference", "issue", 
-                                                 "in", "as of", "on", "at", "by"]:
-                            entity_value = matches.group(i)
+                        group = matches.group(i)
+                        if group not in _ENTITY_QUALIFIERS:
+                            if group is not None and same_length:
+                                group = query[matches.start(i):matches.end(i)]
+                            entity_value = group
                             break
                     
                     if entity_value:
                         # Special handling for variance type
                         if entity_type == "variance_type":
-                            if entity_value.upper() in ["CV", "CPI"]:
-                                entity_value = "cost"
-                            elif entity_value.upper() in ["SV", "SPI"]:
-                                entity_value = "schedule"
+                            entity_value = _VARIANCE_ALIASES.get(entity_value.lower(), entity_value)
                         
                         entities[entity_type] = entity_value
                         break  # Stop after first match for this entity type
@@ -1,5 +1,6 @@
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from types import MappingProxyType
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from pydantic import BaseModel
 
@@ -19,6 +20,85 @@ from src.data_ingestion.database import Database
 
 router = APIRouter(prefix="/api/v1/physical", tags=["Physical EVM"])
 
+# Simulated payloads are immutable and shared across requests; only
+# per-request fields (project_id, timestamps) are filled in by the endpoints.
+_SIMULATED_RESOURCES = (
+    MappingProxyType({
+        "resource_type": "labor",
+        "resource_name": "Concrete crew",
+        "planned_productivity": 15.0,  # units per day
+        "actual_productivity": 13.2,   # units per day
+        "productivity_index": 0.88,    # actual / planned
+        "trend": "declining",
+        "contributing_factors": ("Weather delays", "Material quality issues")
+    }),
+    MappingProxyType({
+        "resource_type": "equipment",
+        "resource_name": "Excavator",
+        "planned_productivity": 45.0,  # cubic yards per day
+        "actual_productivity": 42.3,   # cubic yards per day
+        "productivity_index": 0.94,    # actual / planned
+        "trend": "stable",
+        "contributing_factors": ("Operator experience",)
+    })
+)
+
+_SIMULATED_CURRENT_WEATHER = MappingProxyType({
+    "temperature": 72.5,  # °F
+    "conditions": "Partly cloudy",
+    "precipitation": 0.0,  # inches
+    "wind_speed": 8.5,  # mph
+    "humidity": 65  # %
+})
+
+# Forecast entries without their "date", which is stamped per request
+_SIMULATED_FORECAST = (
+    MappingProxyType({
+        "conditions": "Partly cloudy",
+        "high_temp": 75.0,
+        "low_temp": 62.0,
+        "precipitation_chance": 20,
+        "work_impact": "low"
+    }),
+    MappingProxyType({
+        "conditions": "Rain",
+        "high_temp": 68.0,
+        "low_temp": 59.0,
+        "precipitation_chance": 80,
+        "precipitation_amount": 0.5,
+        "work_impact": "high"
+    })
+)
+
+_SIMULATED_WEATHER_ALERTS = ("Rain expected tomorrow, may impact exterior work",)
+
+_SIMULATED_SITE_ACCESS = MappingProxyType({
+    "status": "normal",
+    "restrictions": (),
+    "delivery_access": "clear"
+})
+
+_SIMULATED_SITE_CONDITIONS = MappingProxyType({
+    "ground_conditions": "dry",
+    "hazards": (),
+    "safety_concerns": ()
+})
+
+_SIMULATED_IOT_SENSORS = MappingProxyType({
+    "moisture_sensors": (
+        MappingProxyType({"location": "North foundation", "reading": 15, "unit": "%", "status": "normal"}),
+        MappingProxyType({"location": "South foundation", "reading": 22, "unit": "%", "status": "warning"})
+    ),
+    "temperature_sensors": (
+        MappingProxyType({"location": "Concrete curing area", "reading": 68.5, "unit": "°F", "status": "normal"}),
+    )
+})
+
+_SIMULATED_SCAN_RECOMMENDATIONS = (
+    "Schedule indoor work for tomorrow due to expected rain",
+    "Investigate elevated moisture readings in South foundation"
+)
+
 # Dependencies
 def get_physical_ai_assistant():
     """Dependency to get the Physical EVM Assistant instance."""
@@ -212,32 +292,14 @@ async def get_resource_productivity(
     """
     # In a real implementation, this would query the database and perform productivity analysis
     # For now, we'll return a simulated response
+    now = datetime.now()
     return {
         "project_id": project_id,
         "analysis_period": {
-            "from": date_from or datetime.now(),
-            "to": date_to or datetime.now()
+            "from": date_from or now,
+            "to": date_to or now
         },
-        "resources": [
-            {
-                "resource_type": "labor",
-                "resource_name": "Concrete crew",
-                "planned_productivity": 15.0,  # units per day
-                "actual_productivity": 13.2,   # units per day
-                "productivity_index": 0.88,    # actual / planned
-                "trend": "declining",
-                "contributing_factors": ["Weather delays", "Material quality issues"]
-            },
-            {
-                "resource_type": "equipment",
-                "resource_name": "Excavator",
-                "planned_productivity": 45.0,  # cubic yards per day
-                "actual_productivity": 42.3,   # cubic yards per day
-                "productivity_index": 0.94,    # actual / planned
-                "trend": "stable",
-                "contributing_factors": ["Operator experience"]
-            }
-        ],
+        "resources": _SIMULATED_RESOURCES,
         "summary": "Overall resource productivity is 6% below plan, primarily due to weather impacts on concrete work."
     }
 
@@ -254,10 +316,11 @@ async def compare_physical_vs_reported(
     """
     # In a real implementation, this would query the database and perform analysis
     # For now, we'll return a simulated response
+    now = datetime.now()
     return {
         "project_id": project_id,
         "wbs_element": wbs_element or "All",
-        "analysis_date": datetime.now(),
+        "analysis_date": now,
         "overall_physical_progress": 0.42,  # 42% complete
         "overall_reported_progress": 0.45,  # 45% complete
         "variance": -0.03,  # physical - reported
@@ -297,59 +360,17 @@ async def get_environmental_scan(
     """
     # In a real implementation, this would query external APIs and IoT sensors
     # For now, we'll return a simulated response
+    now = datetime.now()
     return {
         "project_id": project_id,
-        "scan_date": datetime.now(),
+        "scan_date": now,
         "weather": {
-            "current": {
-                "temperature": 72.5,  # °F
-                "conditions": "Partly cloudy",
-                "precipitation": 0.0,  # inches
-                "wind_speed": 8.5,  # mph
-                "humidity": 65  # %
-            },
-            "forecast": [
-                {
-                    "date": datetime.now(),
-                    "conditions": "Partly cloudy",
-                    "high_temp": 75.0,
-                    "low_temp": 62.0,
-                    "precipitation_chance": 20,
-                    "work_impact": "low"
-                },
-                {
-                    "date": datetime.now(),
-                    "conditions": "Rain",
-                    "high_temp": 68.0,
-                    "low_temp": 59.0,
-                    "precipitation_chance": 80,
-                    "precipitation_amount": 0.5,
-                    "work_impact": "high"
-                }
-            ],
-            "weather_alerts": ["Rain expected tomorrow, may impact exterior work"]
-        },
-        "site_access": {
-            "status": "normal",
-            "restrictions": [],
-            "delivery_access": "clear"
-        },
-        "site_conditions": {
-            "ground_conditions": "dry",
-            "hazards": [],
-            "safety_concerns": []
-        },
-        "iot_sensors": {
-            "moisture_sensors": [
-                {"location": "North foundation", "reading": 15, "unit": "%", "status": "normal"},
-                {"location": "South foundation", "reading": 22, "unit": "%", "status": "warning"}
-            ],
-            "temperature_sensors": [
-                {"location": "Concrete curing area", "reading": 68.5, "unit": "°F", "status": "normal"}
-            ]
+            "current": _SIMULATED_CURRENT_WEATHER,
+            "forecast": [{"date": now, **entry} for entry in _SIMULATED_FORECAST],
+            "weather_alerts": _SIMULATED_WEATHER_ALERTS
         },
-        "recommendations": [
-            "Schedule indoor work for tomorrow due to expected rain",
-            "Investigate elevated moisture readings in South foundation"
-        ]
+        "site_access": _SIMULATED_SITE_ACCESS,
+        "site_conditions": _SIMULATED_SITE_CONDITIONS,
+        "iot_sensors": _SIMULATED_IOT_SENSORS,
+        "recommendations": _SIMULATED_SCAN_RECOMMENDATIONS
     }
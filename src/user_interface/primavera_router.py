@@ -1,9 +1,18 @@
 """FastAPI router for Primavera P6 integration with CSCSC AI Agent."""
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi import APIRouter, HTTPException, Depends, Query, Path, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import os
+import re
 import json
+import orjson
+import time
+import asyncio
+import logging
+import weakref
+from functools import wraps
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -11,11 +20,32 @@ from src.integration.primavera_connector import PrimaveraConnector
 from src.integration.primavera_data_processor import PrimaveraDataProcessor
 from src.integration.primavera_database import PrimaveraDatabase
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.inmemory import InMemoryBackend
+    from fastapi_cache.backends.redis import RedisBackend
+    from fastapi_cache.coder import JsonCoder
+    from fastapi_cache.decorator import cache
+    from fastapi_cache.key_builder import default_key_builder
+    from redis import asyncio as aioredis
+    HAS_FASTAPI_CACHE = True
+except ImportError:
+    HAS_FASTAPI_CACHE = False
+
+logger = logging.getLogger(__name__)
+
 # Create router for Primavera P6 integration
 router = APIRouter(
     prefix="/api/v1/primavera",
     tags=["primavera"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 # Initialize components
@@ -24,7 +54,226 @@ connector = PrimaveraConnector()
 data_processor = PrimaveraDataProcessor(connector, P6_PATH)
 database = PrimaveraDatabase()
 
-# Pydantic models for request/response validation
+
+# Dependencies. Providers are async so FastAPI resolves them on the event loop
+# instead of sending each one through the threadpool.
+async def get_connector() -> PrimaveraConnector:
+    """Dependency to get the shared Primavera connector."""
+    return connector
+
+
+async def get_data_processor() -> PrimaveraDataProcessor:
+    """Dependency to get the shared Primavera data processor."""
+    return data_processor
+
+
+async def get_database() -> PrimaveraDatabase:
+    """Dependency to get the shared Primavera database."""
+    return database
+
+
+async def _run_db(func, *args, **kwargs):
+    """Run a blocking database call in a worker thread without stalling the event loop.
+    
+    PrimaveraDatabase keeps one connection per thread, so calls may run concurrently.
+    """
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+# Guard the connector's check-then-connect so concurrent requests connect only
+# once. Locks are created inside the running loop, one per loop, since before
+# Python 3.10 a lock binds to the loop that is current when it is created.
+_connect_locks = weakref.WeakKeyDictionary()
+
+
+def _get_connect_lock():
+    """Return the connect lock for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    lock = _connect_locks.get(loop)
+    if lock is None:
+        lock = _connect_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _ensure_connected(conn, connection_type=None):
+    """Connect the connector unless it is already connected.
+    
+    Args:
+        conn: Connector to connect
+        connection_type: Connection type to switch the connector to first, if any
+        
+    Returns:
+        bool: Whether the connector is connected
+    """
+    async with _get_connect_lock():
+        if connection_type and connection_type != conn.connection_type:
+            await run_in_threadpool(conn.disconnect)
+            conn.connection_type = connection_type
+        
+        if not conn.is_connected:
+            await run_in_threadpool(conn.connect)
+        
+        return conn.is_connected
+
+
+# How long the P6 installation check in get_status is reused, in seconds
+_P6_EXISTS_TTL = 30.0
+_p6_exists_cache = (float("-inf"), False)
+
+
+def _p6_exists():
+    """Return whether P6_PATH exists, checking the filesystem at most once per TTL."""
+    global _p6_exists_cache
+    checked_at, exists = _p6_exists_cache
+    now = time.monotonic()
+    if now - checked_at > _P6_EXISTS_TTL:
+        exists = os.path.exists(P6_PATH)
+        _p6_exists_cache = (now, exists)
+    return exists
+
+
+# Response caching for polled endpoints (requires fastapi-cache2)
+_CACHE_NAMESPACE = "primavera"
+
+
+def init_response_cache(redis_url=None):
+    """Initialize the response cache backend; call once at application startup.
+    
+    Uses Redis when a URL is given so workers share one cache, otherwise an
+    in-process cache.
+    """
+    if not HAS_FASTAPI_CACHE:
+        return
+    
+    if redis_url:
+        backend = RedisBackend(aioredis.from_url(redis_url))
+    else:
+        backend = InMemoryBackend()
+    FastAPICache.init(backend, prefix="primavera-cache")
+
+
+if HAS_FASTAPI_CACHE:
+    class _ResponseCoder(JsonCoder):
+        """Coder that stores responses as JSON bytes and replays them verbatim.
+        
+        Endpoints may return a ready Response (e.g. pre-serialized demo data),
+        which JsonCoder would encode attribute by attribute; cached hits are
+        served as raw JSON so they are not re-validated either.
+        """
+        
+        @classmethod
+        def encode(cls, value):
+            if isinstance(value, Response):
+                return value.body
+            return super().encode(value)
+        
+        @classmethod
+        def decode(cls, value):
+            return Response(content=value, media_type="application/json")
+
+
+# Headers fastapi-cache2 sets for clients on cached endpoints
+_CACHE_HEADERS = ("Cache-Control", "ETag")
+
+
+def _cache_key_builder(func, namespace="", request=None, response=None, args=None, kwargs=None):
+    """Build a cache key from the endpoint's own parameters, ignoring injected components.
+    
+    Component reprs contain memory addresses, which would give every worker
+    sharing a Redis cache its own keys.
+    """
+    kwargs = {
+        name: value for name, value in (kwargs or {}).items()
+        if not isinstance(value, (PrimaveraConnector, PrimaveraDataProcessor, PrimaveraDatabase))
+    }
+    return default_key_builder(func, namespace, request=request, response=response, args=args, kwargs=kwargs)
+
+
+def _cached(expire):
+    """Cache an endpoint's response for `expire` seconds when fastapi-cache2 is installed."""
+    if not HAS_FASTAPI_CACHE:
+        return lambda func: func
+    
+    def decorator(func):
+        cached_func = cache(expire=expire, namespace=_CACHE_NAMESPACE, coder=_ResponseCoder, key_builder=_cache_key_builder)(func)
+        
+        @wraps(cached_func)
+        async def wrapper(*args, **kwargs):
+            response = kwargs.get("response")
+            result = await cached_func(*args, **kwargs)
+            # fastapi-cache2 sets Cache-Control and ETag on the injected response,
+            # which FastAPI drops when the endpoint returns a Response of its own
+            # (including every cache hit), so copy them onto the returned one
+            if response is not None and isinstance(result, Response) and result is not response:
+                for header in _CACHE_HEADERS:
+                    if header in response.headers:
+                        result.headers[header] = response.headers[header]
+            return result
+        
+        return wrapper
+    return decorator
+
+
+async def _clear_response_cache():
+    """Drop cached Primavera responses, e.g. after new data was imported.
+    
+    Failures are logged rather than raised: the data change that triggered the
+    clear has already been committed, and stale entries still expire on their own.
+    """
+    if not HAS_FASTAPI_CACHE:
+        return
+    try:
+        await FastAPICache.clear(namespace=_CACHE_NAMESPACE)
+    except Exception as e:
+        # Covers an unreachable backend as well as a cache that was never initialized
+        logger.warning(f"Failed to clear Primavera response cache: {e}")
+
+# Keywords that determine how a natural-language query is answered, in priority order
+_LATE_KEYWORDS = frozenset({"late", "behind", "delay", "overdue"})
+_PROGRESS_KEYWORDS = frozenset({"progress", "status", "completion", "percent"})
+_RESOURCE_KEYWORDS = frozenset({"resource", "allocation", "utilization"})
+_CRITICAL_KEYWORDS = frozenset({"critical", "path", "key activities"})
+_QUERY_INTENT_KEYWORDS = (
+    ("late", _LATE_KEYWORDS),
+    ("progress", _PROGRESS_KEYWORDS),
+    ("resource", _RESOURCE_KEYWORDS),
+    ("critical", _CRITICAL_KEYWORDS),
+)
+_QUERY_INTENT_PRIORITY = {intent: rank for rank, (intent, _) in enumerate(_QUERY_INTENT_KEYWORDS)}
+
+if HAS_AHOCORASICK:
+    # One automaton finds every keyword of every intent in a single pass over the query
+    _QUERY_AUTOMATON = ahocorasick.Automaton()
+    for _intent, _keywords in _QUERY_INTENT_KEYWORDS:
+        for _keyword in _keywords:
+            _QUERY_AUTOMATON.add_word(_keyword, _intent)
+    _QUERY_AUTOMATON.make_automaton()
+else:
+    # Without pyahocorasick, one compiled pattern with a named branch per intent,
+    # in priority order; the first branch whose keywords occur anywhere in the
+    # query matches, so its name (lastgroup) is the intent. Keywords match as
+    # substrings ("delayed" still hits "delay").
+    _QUERY_INTENT_RE = re.compile('|'.join(
+        r'(?=.*?(?:' + '|'.join(re.escape(kw) for kw in sorted(keywords)) + r'))(?P<' + intent + r'>)'
+        for intent, keywords in _QUERY_INTENT_KEYWORDS
+    ), re.DOTALL)
+
+
+def _classify_query(query_lower):
+    """Return the highest-priority intent with a keyword in the query, or None."""
+    if HAS_AHOCORASICK:
+        hits = {intent for _, intent in _QUERY_AUTOMATON.iter(query_lower)}
+        return min(hits, key=_QUERY_INTENT_PRIORITY.__getitem__, default=None)
+    
+    match = _QUERY_INTENT_RE.match(query_lower)
+    return match.lastgroup if match else None
+
+
+# Pydantic models for request/response validation. Status, import and database
+# or demo project payloads are built from known-good values and returned as
+# ORJSONResponse, which skips response_model validation. Projects passed through
+# from P6 are returned as a dict so ProjectsResponse still validates them; /query
+# has no response model, so its dicts are only encoded.
 class StatusResponse(BaseModel):
     status: str
     connection: str
@@ -62,16 +311,18 @@ class QueryRequest(BaseModel):
 
 
 @router.get("/status", response_model=StatusResponse, responses={500: {"model": ErrorResponse}})
-async def get_status():
+@_cached(expire=10)
+async def get_status(conn: PrimaveraConnector = Depends(get_connector)):
     """Get status of Primavera P6 integration."""
     try:
-        connection_status = connector.connect()
-        return {
+        # Only connects if no connection has been established yet
+        connection_status = await _ensure_connected(conn)
+        return ORJSONResponse(content={
             "status": "success",
             "connection": "active" if connection_status else "inactive",
             "p6_path": P6_PATH,
-            "p6_exists": os.path.exists(P6_PATH)
-        }
+            "p6_exists": _p6_exists()
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail={
             "status": "error",
@@ -80,11 +331,15 @@ async def get_status():
 
 
 @router.get("/projects", response_model=ProjectsResponse, responses={500: {"model": ErrorResponse}})
-async def get_projects():
+@_cached(expire=60)
+async def get_projects(
+    conn: PrimaveraConnector = Depends(get_connector),
+    db: PrimaveraDatabase = Depends(get_database)
+):
     """Get all projects from Primavera P6."""
     try:
         # First check database
-        db_projects = database.get_projects()
+        db_projects = await _run_db(db.get_projects)
         
         if db_projects:
             # Use projects from database
@@ -96,19 +351,19 @@ async def get_projects():
                 "progress": p.get("progress", 0)
             } for p in db_projects]
             
-            return {
+            return ORJSONResponse(content={
                 "status": "success",
                 "projects": projects,
                 "source": "database"
-            }
+            })
         
         # If no projects in database, try to get from P6
-        connector.connect()
-        p6_projects = connector.get_projects()
+        await _ensure_connected(conn)
+        p6_projects = await run_in_threadpool(conn.get_projects)
         
         if p6_projects:
             # Store projects in database
-            database.store_projects(p6_projects)
+            await _run_db(db.store_projects, p6_projects)
             
             # Format projects for response
             projects = [{
@@ -125,14 +380,8 @@ async def get_projects():
                 "source": "primavera"
             }
         
-        # If no projects in P6, generate demo data
-        demo_projects = generate_demo_projects()
-        
-        return {
-            "status": "success",
-            "projects": demo_projects,
-            "source": "demo"
-        }
+        # If no projects in P6, serve the pre-serialized demo data
+        return Response(content=_DEMO_PROJECTS_BYTES, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail={
             "status": "error",
@@ -141,26 +390,33 @@ async def get_projects():
 
 
 @router.get("/projects/{proj_id}/details", responses={500: {"model": ErrorResponse}})
-async def get_project_details(proj_id: str = Path(..., title="Project ID")):
+async def get_project_details(
+    proj_id: str = Path(..., title="Project ID"),
+    processor: PrimaveraDataProcessor = Depends(get_data_processor)
+):
     """Get detailed information for a specific project."""
     try:
         # Get project data
-        project_data = data_processor.get_project_data(proj_id)
+        project_data = await run_in_threadpool(processor.get_project_data, proj_id)
         
         if not project_data:
             # Try to generate demo data for project
+            if proj_id in _DEMO_DETAIL_BYTES:
+                return Response(content=_DEMO_DETAIL_BYTES[proj_id], media_type="application/json")
             return generate_demo_project_details(proj_id)
         
         # Process data for visualization
-        visualization_data = data_processor.prepare_for_visualization(project_data)
+        visualization_data = processor.prepare_for_visualization(project_data)
         
-        return {
-            "status": "success",
-            "project_id": proj_id,
-            "gantt_data": visualization_data.get("gantt_data", [])[0] if visualization_data.get("gantt_data") else None,
-            "resource_data": visualization_data.get("resource_data", [])[0] if visualization_data.get("resource_data") else None,
-            "progress_data": visualization_data.get("progress_data", [])[0] if visualization_data.get("progress_data") else None
-        }
+        # Gantt tasks grow with the project, so only they are encoded while the
+        # body streams; everything else is encoded here where errors become a 500
+        head, tasks, tail = _encode_project_details(
+            proj_id,
+            visualization_data.get("gantt_data", [])[0] if visualization_data.get("gantt_data") else None,
+            visualization_data.get("resource_data", [])[0] if visualization_data.get("resource_data") else None,
+            visualization_data.get("progress_data", [])[0] if visualization_data.get("progress_data") else None
+        )
+        return StreamingResponse(_stream_project_details(head, tasks, tail), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail={
             "status": "error",
@@ -181,36 +437,19 @@ async def query_primavera_data(query_req: QueryRequest):
             })
         
         # Process query using simple keyword matching
-        query_lower = query.lower()
+        intent = _classify_query(query.lower())
         
-        # Determine query intent
-        if any(keyword in query_lower for keyword in ["late", "behind", "delay", "overdue"]):
-            # Query for late activities
-            result = query_late_activities()
-            text_result = "Here are the activities that are behind schedule:"
-            visualization = create_late_activities_visualization(result)
-        elif any(keyword in query_lower for keyword in ["progress", "status", "completion", "percent"]):
-            # Query for project progress
-            result = query_project_progress()
-            text_result = "Here is the current progress status of all projects:"
-            visualization = create_progress_visualization(result)
-        elif any(keyword in query_lower for keyword in ["resource", "allocation", "utilization"]):
-            # Query for resource allocation
-            result = query_resource_allocation()
-            text_result = "Here is the current resource allocation across projects:"
-            visualization = create_resource_visualization(result)
-        elif any(keyword in query_lower for keyword in ["critical", "path", "key activities"]):
-            # Query for critical path
-            result = query_critical_path()
-            text_result = "Here are the activities on the critical path:"
-            visualization = create_critical_path_visualization(result)
-        else:
+        if intent is None:
             # Default response for unknown queries
             return {
                 "status": "success",
                 "result": f"I'm not sure how to answer: '{query}'. Try asking about late activities, project progress, resource allocation, or critical path."
             }
         
+        query_data, text_result, create_visualization = _QUERY_HANDLERS[intent]
+        result = query_data()
+        visualization = create_visualization(result)
+        
         return {
             "status": "success",
             "text_result": text_result,
@@ -227,15 +466,18 @@ async def query_primavera_data(query_req: QueryRequest):
 
 
 @router.post("/import", response_model=ImportResponse, responses={500: {"model": ErrorResponse}})
-async def import_primavera_data(import_req: ImportRequest):
+async def import_primavera_data(
+    import_req: ImportRequest,
+    conn: PrimaveraConnector = Depends(get_connector),
+    db: PrimaveraDatabase = Depends(get_database)
+):
     """Import data from Primavera P6."""
     try:
         import_type = import_req.type
         source = import_req.source
         
         # Connect to Primavera
-        connector.connection_type = import_type
-        connection_success = connector.connect()
+        connection_success = await _ensure_connected(conn, import_type)
         
         if not connection_success:
             raise HTTPException(status_code=500, detail={
@@ -243,36 +485,31 @@ async def import_primavera_data(import_req: ImportRequest):
                 "message": f"Failed to connect to Primavera using {import_type} connection"
             })
         
-        # Import projects
-        projects = connector.get_projects()
-        project_count = database.store_projects(projects)
-        
-        # Import activities for each project
-        activity_count = 0
-        for project in projects:
-            activities = connector.get_activities(project.get("proj_id"))
-            activity_count += database.store_activities(activities)
+        # Fetch projects, then activities for all projects in one bulk call
+        projects = await run_in_threadpool(conn.get_projects)
+        proj_ids = [project.get("proj_id") for project in projects]
+        all_activities = await run_in_threadpool(conn.get_activities_bulk, proj_ids)
         
-        # Log import
-        import_id = database.store_import_log(
-            import_type=import_type,
-            source=source,
-            status="success",
-            message=f"Imported {project_count} projects and {activity_count} activities",
-            metadata={"project_count": project_count, "activity_count": activity_count}
+        # Store everything and log the import in a single transaction
+        project_count, activity_count, import_id = await _run_db(
+            _store_import, db, projects, all_activities, import_type, source
         )
         
-        return {
+        # Make freshly imported projects visible immediately
+        await _clear_response_cache()
+        
+        return ORJSONResponse(content={
             "status": "success",
             "import_id": import_id,
             "project_count": project_count,
             "activity_count": activity_count
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         # Log import error
-        database.store_import_log(
+        await _run_db(
+            db.store_import_log,
             import_type=import_req.type,
             source=import_req.source,
             status="error",
@@ -285,6 +522,73 @@ async def import_primavera_data(import_req: ImportRequest):
         })
 
 
+# Same options ORJSONResponse uses, so streamed and regular responses encode alike
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Number of Gantt tasks encoded into each streamed chunk
+_STREAM_TASK_BATCH = 500
+
+
+def _encode_project_details(proj_id, gantt_data, resource_data, progress_data):
+    """Encode everything in a project details response except the Gantt task list.
+    
+    Runs before the response starts so that bad data still produces the
+    regular error response instead of a truncated body.
+    
+    Returns:
+        tuple: JSON before the task list, the tasks to stream, JSON after the task list
+    """
+    project_id = orjson.dumps(proj_id, option=_ORJSON_OPTIONS)
+    tail = (b',"resource_data":' + orjson.dumps(resource_data, option=_ORJSON_OPTIONS)
+            + b',"progress_data":' + orjson.dumps(progress_data, option=_ORJSON_OPTIONS) + b'}')
+    
+    if gantt_data is None:
+        return b'{"status":"success","project_id":' + project_id + b',"gantt_data":null', [], tail
+    
+    tasks = list(gantt_data.get("tasks", []))
+    header = orjson.dumps({key: value for key, value in gantt_data.items() if key != "tasks"},
+                          option=_ORJSON_OPTIONS)
+    head = (b'{"status":"success","project_id":' + project_id + b',"gantt_data":'
+            + header[:-1] + (b',' if len(header) > 2 else b'') + b'"tasks":[')
+    return head, tasks, b']}' + tail
+
+
+def _stream_project_details(head, tasks, tail):
+    """Yield a pre-encoded project details response, encoding Gantt tasks in batches.
+    
+    Only the task list is encoded while streaming, so the full document is
+    never held as a single buffer.
+    """
+    yield head
+    for start in range(0, len(tasks), _STREAM_TASK_BATCH):
+        batch = b','.join(orjson.dumps(task, option=_ORJSON_OPTIONS)
+                          for task in tasks[start:start + _STREAM_TASK_BATCH])
+        yield (b',' if start else b'') + batch
+    yield tail
+
+
+def _store_import(db, projects, activities, import_type, source):
+    """Store imported projects and activities and log the import, committing once.
+    
+    Runs as one blocking call so the whole transaction stays on a single
+    thread's connection.
+    
+    Returns:
+        tuple: Project count, activity count and import log ID
+    """
+    with db.transaction():
+        project_count = db.store_projects(projects)
+        activity_count = db.store_activities_bulk(activities)
+        import_id = db.store_import_log(
+            import_type=import_type,
+            source=source,
+            status="success",
+            message=f"Imported {project_count} projects and {activity_count} activities",
+            metadata={"project_count": project_count, "activity_count": activity_count}
+        )
+    return project_count, activity_count, import_id
+
+
 # Helper functions for generating demo data
 def generate_demo_projects():
     """Generate demo projects when no real data is available."""
@@ -314,7 +618,16 @@ def generate_demo_projects():
 
 
 def generate_demo_project_details(proj_id):
-    """Generate detailed demo project data."""
+    """Generate detailed demo project data.
+    
+    Details for the built-in demo projects are built once at import and shared
+    between calls, so callers must not mutate the result.
+    """
+    return _DEMO_DETAILS.get(proj_id) or _build_demo_details(proj_id)
+
+
+def _build_demo_details(proj_id):
+    """Build detailed demo project data for a project ID."""
     # Generate activities based on the project ID
     activities = [
         {
@@ -482,6 +795,35 @@ def generate_demo_project_details(proj_id):
     }
 
 
+def _freeze_demo_details(details):
+    """Turn the shared lists of prebuilt demo details into tuples.
+    
+    Tuples serialize to the same JSON arrays but cannot be appended to or
+    reordered by a caller holding the cached object.
+    """
+    gantt_data = details["gantt_data"]
+    gantt_data["critical_path"] = tuple(gantt_data["critical_path"])
+    details["progress_data"] = {key: tuple(values) for key, values in details["progress_data"].items()}
+    return details
+
+
+_DEMO_DETAILS = {
+    proj_id: _freeze_demo_details(_build_demo_details(proj_id))
+    for proj_id in ("DEMO-001", "DEMO-002", "DEMO-003")
+}
+
+# Demo responses never change, so they are encoded once and served as bytes
+_DEMO_PROJECTS_BYTES = orjson.dumps({
+    "status": "success",
+    "projects": generate_demo_projects(),
+    "source": "demo"
+}, option=_ORJSON_OPTIONS)
+_DEMO_DETAIL_BYTES = {
+    proj_id: orjson.dumps(details, option=_ORJSON_OPTIONS)
+    for proj_id, details in _DEMO_DETAILS.items()
+}
+
+
 def query_late_activities():
     """Query for late activities across projects."""
     # In a real implementation, this would query the database
@@ -513,16 +855,23 @@ def query_late_activities():
 
 def create_late_activities_visualization(late_activities):
     """Create visualization data for late activities."""
+    labels = []
+    delays = []
+    colors = []
+    for activity in late_activities:
+        labels.append(activity["activity_name"])
+        delays.append(activity["delay"])
+        impact = activity["impact"]
+        colors.append("#dc3545" if impact == "High" else ("#ffc107" if impact == "Medium" else "#28a745"))
+    
     return {
         "type": "bar",
         "data": {
-            "labels": [activity["activity_name"] for activity in late_activities],
+            "labels": labels,
             "datasets": [{
                 "label": "Delay (Days)",
-                "data": [activity["delay"] for activity in late_activities],
-                "backgroundColor": ["#dc3545" if activity["impact"] == "High" else 
-                                  ("#ffc107" if activity["impact"] == "Medium" else "#28a745") 
-                                  for activity in late_activities]
+                "data": delays,
+                "backgroundColor": colors
             }]
         }
     }
@@ -562,21 +911,29 @@ def query_project_progress():
 
 def create_progress_visualization(progress_data):
     """Create visualization data for project progress."""
+    labels = []
+    planned = []
+    actual = []
+    for project in progress_data:
+        labels.append(project["project_name"])
+        planned.append(project["planned_progress"])
+        actual.append(project["actual_progress"])
+    
     return {
         "type": "bar",
         "data": {
-            "labels": [project["project_name"] for project in progress_data],
+            "labels": labels,
             "datasets": [
                 {
                     "label": "Planned Progress (%)",
-                    "data": [project["planned_progress"] for project in progress_data],
+                    "data": planned,
                     "backgroundColor": "rgba(54, 162, 235, 0.5)",
                     "borderColor": "rgba(54, 162, 235, 1)",
                     "borderWidth": 1
                 },
                 {
                     "label": "Actual Progress (%)",
-                    "data": [project["actual_progress"] for project in progress_data],
+                    "data": actual,
                     "backgroundColor": "rgba(255, 99, 132, 0.5)",
                     "borderColor": "rgba(255, 99, 132, 1)",
                     "borderWidth": 1
@@ -604,17 +961,22 @@ def query_resource_allocation():
 
 def create_resource_visualization(resource_data):
     """Create visualization data for resource allocation."""
+    labels = []
+    utilization = []
+    colors = []
+    for resource in resource_data:
+        labels.append(resource["resource"])
+        utilization.append(resource["utilization"])
+        colors.append("rgba(220, 53, 69, 0.7)" if resource["overallocation"] else "rgba(40, 167, 69, 0.7)")
+    
     return {
         "type": "horizontalBar",
         "data": {
-            "labels": [resource["resource"] for resource in resource_data],
+            "labels": labels,
             "datasets": [{
                 "label": "Resource Utilization (%)",
-                "data": [resource["utilization"] for resource in resource_data],
-                "backgroundColor": [
-                    "rgba(220, 53, 69, 0.7)" if resource["overallocation"] else "rgba(40, 167, 69, 0.7)"
-                    for resource in resource_data
-                ]
+                "data": utilization,
+                "backgroundColor": colors
             }]
         }
     }
@@ -697,3 +1059,20 @@ def create_critical_path_visualization(critical_activities):
             ]
         }
     }
+
+
+# Query intent -> (data query, response text, visualization builder)
+_QUERY_HANDLERS = {
+    "late": (query_late_activities,
+             "Here are the activities that are behind schedule:",
+             create_late_activities_visualization),
+    "progress": (query_project_progress,
+                 "Here is the current progress status of all projects:",
+                 create_progress_visualization),
+    "resource": (query_resource_allocation,
+                 "Here is the current resource allocation across projects:",
+                 create_resource_visualization),
+    "critical": (query_critical_path,
+                 "Here are the activities on the critical path:",
+                 create_critical_path_visualization),
+}
@@ -1,11 +1,39 @@
 """Route handlers for the CSCSC AI Agent user interface."""
 
 from flask import Blueprint, render_template, jsonify, request
+from jinja2 import FileSystemBytecodeCache
 import os
 
 # Create blueprint for UI routes
 ui_routes = Blueprint('ui_routes', __name__)
 
+# Environment is read once; it does not change while the process runs
+_FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
+
+# Served as-is by system_info; never mutated
+_SYSTEM_INFO = {
+    'version': '0.9.5',
+    'name': 'CSCSC AI Agent',
+    'environment': _FLASK_ENV
+}
+
+# Templates in templates/ compiled at app start rather than on their first request
+_WARM_TEMPLATES = ('index.html', 'primavera_integration.html')
+
+@ui_routes.record_once
+def _configure_templates(state):
+    """Enable the Jinja2 bytecode cache and warm hot templates when the blueprint is registered."""
+    app = state.app
+    # Without a directory Jinja uses a per-user 0700 cache directory and verifies
+    # its ownership, so other local users cannot plant compiled templates
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+    
+    # Both templates live in user_interface/templates; a TemplateNotFound here means
+    # the app does not serve that folder, so it is raised at startup rather than
+    # on the first request
+    for template_name in _WARM_TEMPLATES:
+        app.jinja_env.get_template(template_name)
+
 @ui_routes.route('/')
 def index():
     """Render the main page of the CSCSC AI Agent."""
@@ -34,8 +62,4 @@ def mpxj_conversion():
 @ui_routes.route('/api/system-info')
 def system_info():
     """Return system information."""
-    return jsonify({
-        'version': '0.9.5',
-        'name': 'CSCSC AI Agent',
-        'environment': os.environ.get('FLASK_ENV', 'production')
-    })
+    return jsonify(_SYSTEM_INFO)
@@ -1,8 +1,28 @@
 from typing import Dict, List, Any, Optional
 import os
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
+import numbers
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import MappingProxyType
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Note: In a production application, these would be replaced with actual plotting libraries
 # like matplotlib, plotly, or bokeh. For this prototype, we'll create JSON structures
@@ -10,6 +30,253 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Weight of each impact severity in the environmental impact heatmap
+_SEVERITY_VALUE = {
+    "low": 1,
+    "medium": 2,
+    "high": 3,
+    "critical": 4
+}
+_DEFAULT_SEVERITY_VALUE = 1
+
+# Fixed parts of the chart schemas, built once and shared by every result.
+# They are frozen so that one consumer's edit can't leak into later charts.
+_HEATMAP_COLOR_SCALE = (
+    (0, "#FFFFFF"),  # No impact
+    (0.25, "#FFEB3B"),  # Low impact
+    (0.5, "#FF9800"),  # Medium impact
+    (0.75, "#F44336"),  # High impact
+    (1, "#9C27B0")  # Critical impact
+)
+
+_RISK_MATRIX_X_AXIS = MappingProxyType({
+    "title": "Likelihood",
+    "min": 0,
+    "max": 1,
+    "tickPositions": (0, 0.25, 0.5, 0.75, 1),
+    "labels": ("Very Low", "Low", "Medium", "High", "Very High")
+})
+
+_RISK_MATRIX_Y_AXIS = MappingProxyType({
+    "title": "Impact",
+    "min": 0,
+    "max": 1,
+    "tickPositions": (0, 0.25, 0.5, 0.75, 1),
+    "labels": ("Minimal", "Minor", "Moderate", "Major", "Severe")
+})
+
+_RISK_MATRIX_ZONES = (
+    MappingProxyType({"value": 0.25, "color": "#4CAF50"}),  # Low risk zone
+    MappingProxyType({"value": 0.5, "color": "#FFEB3B"}),   # Medium risk zone
+    MappingProxyType({"value": 0.75, "color": "#FF9800"}),  # High risk zone
+    MappingProxyType({"value": 1, "color": "#F44336"})     # Critical risk zone
+)
+
+_PRODUCTIVITY_Y_AXIS = MappingProxyType({
+    "title": "Productivity Index",
+    "min": 0,
+    "plotLines": (MappingProxyType({"value": 1, "color": "#000000", "width": 2, "dashStyle": "dash"}),)
+})
+
+# Productivity index color bands: < 0.8, < 0.95, <= 1.05, <= 1.2, above. 0.8 and
+# 0.95 fall in the band above them but 1.05 and 1.2 in the band below, hence
+# two threshold arrays searched from different sides.
+_PRODUCTIVITY_LOWER_THRESHOLDS = np.array([0.8, 0.95])
+_PRODUCTIVITY_UPPER_THRESHOLDS = np.array([1.05, 1.2])
+_PRODUCTIVITY_COLORS = np.array([
+    "#F44336",  # Significantly under-performing
+    "#FF9800",  # Slightly under-performing
+    "#4CAF50",  # On target
+    "#2196F3",  # Slightly over-performing
+    "#673AB7"   # Significantly over-performing
+], dtype=object)
+
+# Weather icon rules in priority order, one named branch per icon. Each branch
+# looks ahead for its keywords anywhere in the lowercased conditions, so one
+# match() returns the first icon that applies as match.lastgroup.
+_WEATHER_ICON_RE = re.compile(
+    r"(?=.*rain)(?P<rain>)"
+    r"|(?=.*(?:snow|flurries))(?P<snow>)"
+    r"|(?=.*cloud)(?=.*partly)(?P<partly_cloudy>)"
+    r"|(?=.*cloud)(?P<cloudy>)"
+    r"|(?=.*(?:sun|clear))(?P<sunny>)"
+    r"|(?=.*(?:storm|thunder))(?P<storm>)"
+    r"|(?=.*(?:fog|hazy))(?P<fog>)"
+    r"|(?=.*wind)(?P<windy>)",
+    re.DOTALL
+)
+
+
+@lru_cache(maxsize=128)
+def _weather_icon(conditions_lower: str) -> str:
+    """Map lowercased weather conditions to an icon name; forecasts repeat a few strings."""
+    match = _WEATHER_ICON_RE.match(conditions_lower)
+    return match.lastgroup if match else "unknown"
+
+
+@lru_cache(maxsize=512)
+def _format_naive_datetime(value: datetime) -> str:
+    """Format a plain naive datetime as YYYY-MM-DD; forecasts repeat a few dates."""
+    return value.strftime("%Y-%m-%d")
+
+
+def _format_date(value):
+    """Format a datetime as YYYY-MM-DD, passing other values through unchanged."""
+    # Equal aware datetimes in different zones would share a cache entry but fall
+    # on different days, so only plain naive datetimes are memoized
+    if type(value) is datetime and value.tzinfo is None:
+        return _format_naive_datetime(value)
+    return value.strftime("%Y-%m-%d") if isinstance(value, datetime) else value
+
+
+def _to_soa(records: List[Dict[str, Any]], fields: Dict[str, float]) -> Dict[str, np.ndarray]:
+    """Convert records into one NumPy column per numeric field.
+    
+    A column whose values are all ints or all floats gets the matching NumPy
+    dtype. A column mixing them keeps the original Python objects, so tolist()
+    returns every value with the type the record held.
+    
+    Args:
+        records: List of record dictionaries
+        fields: Mapping of field name to the default used when a record lacks it
+        
+    Returns:
+        Dict mapping each field name to an array with one value per record
+        
+    Raises:
+        TypeError: If a value is not a real number
+    """
+    columns = {}
+    for name, default in fields.items():
+        values = [record.get(name, default) for record in records]
+        value_types = set(map(type, values))
+        for value_type in value_types:
+            if not issubclass(value_type, numbers.Real):
+                raise TypeError(f"{name} must be a number, not {value_type.__name__}")
+        columns[name] = np.array(values, dtype=object if len(value_types) > 1 else None)
+    return columns
+
+
+def _json_default(obj):
+    """Encode frozen schema parts, NumPy values and datetimes that the encoder can't."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump(obj) -> bytes:
+    """Serialize chart data to JSON bytes, with orjson when it is installed.
+    
+    Naive datetimes are written without an offset by both encoders, as they
+    hold local times, and the fallback uses orjson's compact separators.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Types whose repr() identifies both the value and its type, e.g. 1, 1.0, '1'
+# and True all encode differently
+_REPR_KEY_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes, datetime, date, timedelta})
+
+
+def _canonical(obj):
+    """Build a type-tagged, hashable form of obj in which equal forms mean equal inputs.
+    
+    Raises:
+        TypeError: If obj holds a value of any other type
+    """
+    obj_type = type(obj)
+    if obj_type in _REPR_KEY_TYPES:
+        return repr(obj)
+    if obj_type is list or obj_type is tuple:
+        return (obj_type.__name__,) + tuple(_canonical(item) for item in obj)
+    if obj_type is dict:
+        return ("dict",) + tuple((_canonical(k), _canonical(v)) for k, v in obj.items())
+    if obj_type is np.ndarray and not obj.dtype.hasobject:
+        return ("ndarray", obj.dtype.str, obj.shape, obj.tobytes())
+    if isinstance(obj, np.generic) and not isinstance(obj, np.object_):
+        return ("numpy", obj.dtype.str, obj.tobytes())
+    raise TypeError(f"Cannot build a cache key from {obj_type.__name__}")
+
+
+def _cache_key(args, kwargs) -> Optional[bytes]:
+    """Serialize call arguments to the bytes compared on a cache hit, or None if unsupported."""
+    try:
+        return repr((_canonical(args), _canonical(dict(sorted(kwargs.items()))))).encode("utf-8")
+    except TypeError:
+        return None
+
+
+def _copy_result(obj):
+    """Copy the mutable containers in a cached result; frozen schema parts are shared."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _copy_result(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_copy_result(item) for item in obj]
+    if obj_type is tuple:
+        return tuple(_copy_result(item) for item in obj)
+    if obj_type is np.ndarray:
+        return obj.copy()
+    return obj
+
+
+def _memoize_by_arguments(maxsize: int = 32):
+    """Cache a generator's result per instance and per exact arguments (project ID and data).
+    
+    The key is the type-tagged serialization of the arguments, compared in full
+    on a hit, so only inputs of the same types and values share a result. Each
+    caller gets its own copy of the result. Inputs that can't be serialized
+    (e.g. arbitrary sensor objects) are not cached.
+    """
+    def decorator(func):
+        caches = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = _cache_key(args, kwargs)
+            if key is None:
+                return func(self, *args, **kwargs)
+            
+            with lock:
+                cache = caches.get(self)
+                if cache is not None and key in cache:
+                    cache.move_to_end(key)
+                    return _copy_result(cache[key])
+            
+            result = func(self, *args, **kwargs)
+            with lock:
+                cache = caches.setdefault(self, OrderedDict())
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return _copy_result(result)
+        
+        return wrapper
+    return decorator
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _reduce_impact(rows, cols, values, n_rows, n_cols):
+        """Max-reduce (row, column, value) entries into an n_rows x n_cols grid of zeros."""
+        grid = np.zeros((n_rows, n_cols))
+        for k in range(rows.size):
+            i = rows[k]
+            j = cols[k]
+            if values[k] > grid[i, j]:
+                grid[i, j] = values[k]
+        return grid
+
+
 class EVMVisualizer:
     """Class to generate visualization data for EVM metrics and physical project aspects."""
     
@@ -17,6 +284,7 @@ class EVMVisualizer:
         """Initialize the EVM Visualizer."""
         logger.info("Initializing EVM Visualizer")
     
+    @_memoize_by_arguments()
     def generate_physical_progress_chart(self, project_id: str, metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate data for a chart comparing physical vs. reported progress over time.
         
@@ -34,9 +302,15 @@ class EVMVisualizer:
         
         # Extract data points
         dates = [m.get('date').strftime('%Y-%m-%d') for m in sorted_metrics if 'date' in m]
-        physical_progress = [m.get('physical_percent_complete', 0.0) * 100 for m in sorted_metrics]
-        reported_progress = [m.get('reported_percent_complete', 0.0) * 100 for m in sorted_metrics]
-        variance = [m.get('variance_percentage', 0.0) for m in sorted_metrics]
+        
+        cols = _to_soa(sorted_metrics, {
+            'physical_percent_complete': 0.0,
+            'reported_percent_complete': 0.0,
+            'variance_percentage': 0.0
+        })
+        physical_progress = (cols['physical_percent_complete'] * 100).tolist()
+        reported_progress = (cols['reported_percent_complete'] * 100).tolist()
+        variance = cols['variance_percentage']
         
         chart_data = {
             "project_id": project_id,
@@ -66,17 +340,19 @@ class EVMVisualizer:
         }
         
         # Add annotations for significant variances
-        for i, var in enumerate(variance):
-            if abs(var) > 10:  # Only annotate significant variances
-                chart_data["annotations"].append({
-                    "x": dates[i],
-                    "y": max(physical_progress[i], reported_progress[i]),
-                    "text": f"{var:.1f}% variance",
-                    "color": "#FF5722" if var < 0 else "#4CAF50"
-                })
+        significant = np.flatnonzero(np.abs(variance.astype(np.float64)) > 10)  # Only annotate significant variances
+        if significant.size:
+            # Work only on the annotated points
+            chart_data["annotations"] = [{
+                "x": dates[i],
+                "y": max(physical_progress[i], reported_progress[i]),
+                "text": f"{var:.1f}% variance",
+                "color": "#FF5722" if var < 0 else "#4CAF50"
+            } for i, var in zip(significant.tolist(), variance[significant].tolist())]
         
         return chart_data
     
+    @_memoize_by_arguments()
     def generate_environmental_impact_heatmap(self, project_id: str, impact_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate data for a heatmap showing environmental impacts on project WBS elements.
         
@@ -90,45 +366,52 @@ class EVMVisualizer:
         logger.info(f"Generating environmental impact heatmap for project {project_id}")
         
         # Collect all unique WBS elements and environmental factors
-        wbs_elements = set()
-        factors = set()
+        factors = {impact.get("factor_type", "unknown") for impact in impact_data}
+        wbs_elements = {wbs for impact in impact_data for wbs in impact.get("affected_wbs_elements", [])}
+        
+        # Create a grid of impact values
+        wbs_list = sorted(wbs_elements)
+        factor_list = sorted(factors)
         
+        wbs_index = {wbs: i for i, wbs in enumerate(wbs_list)}
+        factor_index = {factor: j for j, factor in enumerate(factor_list)}
+        
+        # Single pass over the impacts: one (row, column, value) entry per affected WBS element
+        rows, cols, values = [], [], []
         for impact in impact_data:
-            factor_type = impact.get("factor_type", "unknown")
-            factors.add(factor_type)
+            factor = impact.get("factor_type")
+            if factor not in factor_index:
+                continue  # Impacts without a factor type don't count towards any cell
+            
+            # Calculate impact value based on severity and duration
+            severity_value = _SEVERITY_VALUE.get(impact.get("severity", "low"), _DEFAULT_SEVERITY_VALUE)
+            
+            duration = impact.get("duration_days", 1)
+            impact_value = severity_value * min(duration / 5, 2)
             
-            affected_wbs = impact.get("affected_wbs_elements", [])
-            for wbs in affected_wbs:
-                wbs_elements.add(wbs)
+            j = factor_index[factor]
+            for wbs in impact.get("affected_wbs_elements", []):
+                rows.append(wbs_index[wbs])
+                cols.append(j)
+                values.append(impact_value)
+        
+        # Each cell holds the maximum impact value for its WBS element and factor
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        value_array = np.asarray(values, dtype=np.float64)
+        if HAS_NUMBA:
+            impact_grid = _reduce_impact(rows, cols, value_array, len(wbs_list), len(factor_list))
+        else:
+            impact_grid = np.zeros((len(wbs_list), len(factor_list)))
+            np.maximum.at(impact_grid, (rows, cols), value_array)
         
-        # Create a grid of impact values
-        wbs_list = sorted(list(wbs_elements))
-        factor_list = sorted(list(factors))
-        
-        # Initialize grid with zeros
-        impact_grid = []
-        for wbs in wbs_list:
-            row = []
-            for factor in factor_list:
-                # Find the maximum impact value for this WBS and factor
-                max_impact = 0
-                for impact in impact_data:
-                    if (impact.get("factor_type") == factor and 
-                        wbs in impact.get("affected_wbs_elements", [])):
-                        # Calculate impact value based on severity and duration
-                        severity_value = {
-                            "low": 1,
-                            "medium": 2,
-                            "high": 3,
-                            "critical": 4
-                        }.get(impact.get("severity", "low"), 1)
-                        
-                        duration = impact.get("duration_days", 1)
-                        impact_value = severity_value * min(duration / 5, 2)
-                        max_impact = max(max_impact, impact_value)
-                
-                row.append(max_impact)
-            impact_grid.append(row)
+        # Report each cell's first entry that reaches its maximum, so the value keeps
+        # its int or float type; cells without a positive impact hold the integer 0
+        winners = np.flatnonzero((value_array > 0) & (value_array == impact_grid[rows, cols]))
+        cells, first = np.unique(rows[winners] * len(factor_list) + cols[winners], return_index=True)
+        best_entry = np.full(impact_grid.size, -1, dtype=np.intp)
+        best_entry[cells] = winners[first]
+        cell_values = [values[k] if k >= 0 else 0 for k in best_entry.tolist()]
         
         heatmap_data = {
             "project_id": project_id,
@@ -142,29 +425,23 @@ class EVMVisualizer:
                 "title": "WBS Element",
                 "categories": wbs_list
             },
-            "color_scale": [
-                [0, "#FFFFFF"],  # No impact
-                [0.25, "#FFEB3B"],  # Low impact
-                [0.5, "#FF9800"],  # Medium impact
-                [0.75, "#F44336"],  # High impact
-                [1, "#9C27B0"]  # Critical impact
-            ],
+            "color_scale": _HEATMAP_COLOR_SCALE,
             "data": []
         }
         
-        # Format data for heatmap
-        for i, wbs in enumerate(wbs_list):
-            for j, factor in enumerate(factor_list):
-                heatmap_data["data"].append({
-                    "x": j,
-                    "y": i,
-                    "value": impact_grid[i][j],
-                    "wbs": wbs,
-                    "factor": factor
-                })
+        # Format data for heatmap, one cell per WBS element and factor in row-major order
+        grid_cells = ((i, wbs, j, factor) for i, wbs in enumerate(wbs_list) for j, factor in enumerate(factor_list))
+        heatmap_data["data"] = [{
+            "x": j,
+            "y": i,
+            "value": value,
+            "wbs": wbs,
+            "factor": factor
+        } for (i, wbs, j, factor), value in zip(grid_cells, cell_values)]
         
         return heatmap_data
     
+    @_memoize_by_arguments()
     def generate_risk_matrix(self, project_id: str, risk_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate data for a risk matrix visualization.
         
@@ -181,56 +458,38 @@ class EVMVisualizer:
             "project_id": project_id,
             "chart_type": "scatter",
             "title": "Project Risk Matrix",
-            "x_axis": {
-                "title": "Likelihood",
-                "min": 0,
-                "max": 1,
-                "tickPositions": [0, 0.25, 0.5, 0.75, 1],
-                "labels": ["Very Low", "Low", "Medium", "High", "Very High"]
-            },
-            "y_axis": {
-                "title": "Impact",
-                "min": 0,
-                "max": 1,
-                "tickPositions": [0, 0.25, 0.5, 0.75, 1],
-                "labels": ["Minimal", "Minor", "Moderate", "Major", "Severe"]
-            },
-            "zones": [
-                {"value": 0.25, "color": "#4CAF50"},  # Low risk zone
-                {"value": 0.5, "color": "#FFEB3B"},   # Medium risk zone
-                {"value": 0.75, "color": "#FF9800"},  # High risk zone
-                {"value": 1, "color": "#F44336"}     # Critical risk zone
-            ],
+            "x_axis": _RISK_MATRIX_X_AXIS,
+            "y_axis": _RISK_MATRIX_Y_AXIS,
+            "zones": _RISK_MATRIX_ZONES,
             "data": []
         }
         
+        # Calculate risk scores and point sizes for all risks at once
+        cols = _to_soa(risk_elements, {"likelihood": 0.5, "impact": 0.5})
+        likelihood = cols["likelihood"]
+        impact = cols["impact"]
+        risk_score = likelihood * impact
+        point_size = 5 + (risk_score * 15)  # Size between 5 and 20
+        
         # Add risk elements to the matrix
-        for risk in risk_elements:
-            likelihood = risk.get("likelihood", 0.5)
-            impact = risk.get("impact", 0.5)
-            risk_factor = risk.get("risk_factor", "other")
-            wbs = risk.get("wbs_element", "")
-            description = risk.get("description", "")
-            
-            # Calculate point size based on risk score
-            risk_score = likelihood * impact
-            point_size = 5 + (risk_score * 15)  # Size between 5 and 20
-            
-            matrix_data["data"].append({
-                "x": likelihood,
-                "y": impact,
-                "name": f"WBS {wbs}",
-                "description": description,
-                "risk_factor": risk_factor,
-                "risk_score": risk_score,
-                "marker": {
-                    "radius": point_size,
-                    "symbol": "circle"
-                }
-            })
+        matrix_data["data"] = [{
+            "x": x,
+            "y": y,
+            "name": f"WBS {risk.get('wbs_element', '')}",
+            "description": risk.get("description", ""),
+            "risk_factor": risk.get("risk_factor", "other"),
+            "risk_score": score,
+            "marker": {
+                "radius": size,
+                "symbol": "circle"
+            }
+        } for risk, x, y, score, size in zip(
+            risk_elements, likelihood.tolist(), impact.tolist(), risk_score.tolist(), point_size.tolist()
+        )]
         
         return matrix_data
     
+    @_memoize_by_arguments()
     def generate_resource_productivity_chart(self, project_id: str, productivity_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate data for a resource productivity chart.
         
@@ -243,13 +502,14 @@ class EVMVisualizer:
         """
         logger.info(f"Generating resource productivity chart for project {project_id}")
         
-        # Group resources by type
-        resource_types = {}
-        for resource in productivity_data:
-            resource_type = resource.get("resource_type", "other")
-            if resource_type not in resource_types:
-                resource_types[resource_type] = []
-            resource_types[resource_type].append(resource)
+        # Rank resource types by first appearance in a single scan; the ranks
+        # double as group keys, so no per-type lists are built
+        type_rank = {}
+        ranks = np.array([
+            type_rank.setdefault(r.get("resource_type", "other"), len(type_rank))
+            for r in productivity_data
+        ], dtype=np.intp)
+        resource_types = list(type_rank)
         
         chart_data = {
             "project_id": project_id,
@@ -260,44 +520,27 @@ class EVMVisualizer:
                 "title": "Resource",
                 "categories": []
             },
-            "y_axis": {
-                "title": "Productivity Index",
-                "min": 0,
-                "plotLines": [{"value": 1, "color": "#000000", "width": 2, "dashStyle": "dash"}]
-            },
+            "y_axis": _PRODUCTIVITY_Y_AXIS,
             "series": [],
-            "resource_types": list(resource_types.keys())
+            "resource_types": resource_types
         }
         
-        # Process all resources
-        all_resources = []
-        for resource_type, resources in resource_types.items():
-            # Sort by productivity index
-            sorted_resources = sorted(resources, key=lambda x: x.get("productivity_index", 0))
-            all_resources.extend(sorted_resources)
+        # Group resources by type, sorted by productivity index within each type
+        sort_indices = _to_soa(productivity_data, {"productivity_index": 0})["productivity_index"].astype(np.float64)
+        all_resources = [productivity_data[i] for i in np.lexsort((sort_indices, ranks))]
         
         # Build chart data
         chart_data["x_axis"]["categories"] = [r.get("resource_name", "") for r in all_resources]
         
         # Create series for productivity index
-        productivity_data = []
-        colors = []
+        indices = _to_soa(all_resources, {"productivity_index": 1.0})["productivity_index"]
+        productivity_data = indices.tolist()
         
-        for resource in all_resources:
-            index = resource.get("productivity_index", 1.0)
-            productivity_data.append(index)
-            
-            # Color coding based on productivity index
-            if index < 0.8:
-                colors.append("#F44336")  # Significantly under-performing
-            elif index < 0.95:
-                colors.append("#FF9800")  # Slightly under-performing
-            elif index <= 1.05:
-                colors.append("#4CAF50")  # On target
-            elif index <= 1.2:
-                colors.append("#2196F3")  # Slightly over-performing
-            else:
-                colors.append("#673AB7")  # Significantly over-performing
+        # Color coding based on productivity index, bucketed without per-resource branching
+        index_values = indices.astype(np.float64)
+        buckets = (np.searchsorted(_PRODUCTIVITY_LOWER_THRESHOLDS, index_values, side='right')
+                   + np.searchsorted(_PRODUCTIVITY_UPPER_THRESHOLDS, index_values, side='left'))
+        colors = _PRODUCTIVITY_COLORS.take(buckets).tolist()
         
         chart_data["series"].append({
             "name": "Productivity Index",
@@ -356,7 +599,7 @@ class EVMVisualizer:
                     "title": "Weather Forecast",
                     "type": "forecast",
                     "data": [{
-                        "date": f.get("date").strftime("%Y-%m-%d") if isinstance(f.get("date"), datetime) else f.get("date"),
+                        "date": _format_date(f.get("date")),
                         "conditions": f.get("conditions", "Unknown"),
                         "high_temp": f.get("high_temp", 0),
                         "low_temp": f.get("low_temp", 0),
@@ -393,6 +636,20 @@ class EVMVisualizer:
         
         return dashboard_data
     
+    def to_json(self, chart_data: Dict[str, Any]) -> bytes:
+        """Serialize data returned by one of the generators to JSON.
+        
+        NumPy arrays and scalars are encoded directly, so callers may pass
+        data that still holds them.
+        
+        Args:
+            chart_data: Chart or dashboard data
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return _dump(chart_data)
+    
     def _get_weather_icon(self, conditions: str) -> str:
         """Get a weather icon name based on conditions.
         
@@ -402,24 +659,4 @@ class EVMVisualizer:
         Returns:
             str: Icon name
         """
-        conditions_lower = conditions.lower()
-        
-        if "rain" in conditions_lower:
-            return "rain"
-        elif "snow" in conditions_lower or "flurries" in conditions_lower:
-            return "snow"
-        elif "cloud" in conditions_lower:
-            if "partly" in conditions_lower:
-                return "partly_cloudy"
-            else:
-                return "cloudy"
-        elif "sun" in conditions_lower or "clear" in conditions_lower:
-            return "sunny"
-        elif "storm" in conditions_lower or "thunder" in conditions_lower:
-            return "storm"
-        elif "fog" in conditions_lower or "hazy" in conditions_lower:
-            return "fog"
-        elif "wind" in conditions_lower:
-            return "windy"
-        else:
-            return "unknown"
+        return _weather_icon(conditions.lower())
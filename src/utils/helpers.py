@@ -1,12 +1,33 @@
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+from datetime import datetime, timedelta, timezone
 import random
-import os
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
 
-from src.models.schemas import Task, ProjectData, EVMMetrics, Forecast
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+from src.models.schemas import Task, TaskStatus, ProjectData, EVMMetrics, Forecast
 from src.config.settings import settings
+from src.utils.json_helpers import dumps_with_dates, iter_json_sections
+
+
+# English month names indexed by month number, as strftime("%B") gives in the C locale
+_MONTHS = ("", "January", "February", "March", "April", "May", "June",
+           "July", "August", "September", "October", "November", "December")
+
+
+@lru_cache(maxsize=4096)
+def _format_currency(value: float) -> str:
+    """Memoized body of format_currency for non-zero values."""
+    # Formatting the float directly rounds its exact binary value; scaling to
+    # integer cents first rounds differently on half-cent inputs and is slower
+    return f"${value:,.2f}"
 
 
 def format_currency(value: float) -> str:
@@ -18,7 +39,16 @@ def format_currency(value: float) -> str:
     Returns:
         str: Formatted currency string
     """
-    return f"${value:,.2f}"
+    # 0.0 and -0.0 share a cache key but format differently
+    if value == 0:
+        return f"${value:,.2f}"
+    return _format_currency(value)
+
+
+@lru_cache(maxsize=4096)
+def _format_percent(value: float) -> str:
+    """Memoized body of format_percent for non-zero values."""
+    return f"{value * 100:.1f}%"
 
 
 def format_percent(value: float) -> str:
@@ -30,7 +60,16 @@ def format_percent(value: float) -> str:
     Returns:
         str: Formatted percentage string
     """
-    return f"{value * 100:.1f}%"
+    # 0.0 and -0.0 share a cache key but format differently
+    if value == 0:
+        return f"{value * 100:.1f}%"
+    return _format_percent(value)
+
+
+@lru_cache(maxsize=4096)
+def _format_naive_date(date: datetime) -> str:
+    """Memoized body of format_date for plain naive datetimes."""
+    return f"{_MONTHS[date.month]} {date.day:02d}, {date.year}"
 
 
 def format_date(date: datetime) -> str:
@@ -42,9 +81,15 @@ def format_date(date: datetime) -> str:
     Returns:
         str: Formatted date string
     """
-    return date.strftime("%B %d, %Y")
+    # Only plain naive datetimes are memoized: equal aware datetimes in different
+    # zones share a cache key but fall on different calendar dates
+    if type(date) is datetime and date.tzinfo is None:
+        return _format_naive_date(date)
+    return f"{_MONTHS[date.month]} {date.day:02d}, {date.year}"
 
 
+# typed: 1 and 1.0 share a cache key but format differently
+@lru_cache(maxsize=4096, typed=True)
 def format_duration(days: int) -> str:
     """Format a duration in days as a human-readable string.
     
@@ -62,126 +107,65 @@ def format_duration(days: int) -> str:
         return "on schedule"
 
 
+# Unit offsets scaled by integers when building sample dates
+_DAY = timedelta(days=1)
+_MINUTE = timedelta(minutes=1)
+
+# Sample task rows: (id, name, wbs_element, control_account, responsible_person,
+# planned start, planned finish, actual start, actual finish, budget_at_completion,
+# status, percent_complete). Dates are day offsets from "now" (None when unset).
+_SAMPLE_TASK_ROWS = (
+    ("T001", "Requirements Analysis", "1.1", "CA001", "John Analyst", -30, -15, -32, -14, 15000.0, TaskStatus.COMPLETED, 1.0),
+    ("T002", "System Design", "1.2", "CA001", "Sarah Designer", -14, 1, -13, None, 30000.0, TaskStatus.IN_PROGRESS, 0.8),
+    ("T003", "Frontend Development", "1.3.1", "CA002", "Mike Developer", 2, 22, None, None, 40000.0, TaskStatus.NOT_STARTED, 0.0),
+    ("T004", "Backend Development", "1.3.2", "CA002", "Tom Developer", 2, 32, None, None, 50000.0, TaskStatus.NOT_STARTED, 0.0),
+    ("T005", "Testing", "1.4", "CA003", "Lisa Tester", 33, 48, None, None, 25000.0, TaskStatus.NOT_STARTED, 0.0),
+    ("T006", "Deployment", "1.5", "CA003", "David DevOps", 49, 55, None, None, 15000.0, TaskStatus.NOT_STARTED, 0.0),
+    ("T007", "Documentation", "1.6", "CA004", "Emily Writer", 33, 55, None, None, 10000.0, TaskStatus.NOT_STARTED, 0.0),
+    ("T008", "Project Management", "1.7", "CA004", "Robert Manager", -30, 60, -30, None, 30000.0, TaskStatus.IN_PROGRESS, 0.3)
+)
+
+
 def generate_sample_data() -> ProjectData:
     """Generate sample project data for testing or demonstration.
     
+    The sample values are valid by construction, so models are built with
+    construct() and skip Pydantic validation.
+    
     Returns:
         ProjectData: A sample project with tasks
     """
     # Current date as reference point
     now = datetime.now()
     
-    # Create sample tasks
+    # Create sample tasks by binding the row day offsets to now
     tasks = [
-        Task(
-            id="T001",
-            name="Requirements Analysis",
-            wbs_element="1.1",
-            control_account="CA001",
-            responsible_person="John Analyst",
-            planned_start_date=now - timedelta(days=30),
-            planned_finish_date=now - timedelta(days=15),
-            actual_start_date=now - timedelta(days=32),
-            actual_finish_date=now - timedelta(days=14),
-            budget_at_completion=15000.0,
-            status="completed",
-            percent_complete=1.0
-        ),
-        Task(
-            id="T002",
-            name="System Design",
-            wbs_element="1.2",
-            control_account="CA001",
-            responsible_person="Sarah Designer",
-            planned_start_date=now - timedelta(days=14),
-            planned_finish_date=now + timedelta(days=1),
-            actual_start_date=now - timedelta(days=13),
-            budget_at_completion=30000.0,
-            status="in_progress",
-            percent_complete=0.8
-        ),
-        Task(
-            id="T003",
-            name="Frontend Development",
-            wbs_element="1.3.1",
-            control_account="CA002",
-            responsible_person="Mike Developer",
-            planned_start_date=now + timedelta(days=2),
-            planned_finish_date=now + timedelta(days=22),
-            budget_at_completion=40000.0,
-            status="not_started",
-            percent_complete=0.0
-        ),
-        Task(
-            id="T004",
-            name="Backend Development",
-            wbs_element="1.3.2",
-            control_account="CA002",
-            responsible_person="Tom Developer",
-            planned_start_date=now + timedelta(days=2),
-            planned_finish_date=now + timedelta(days=32),
-            budget_at_completion=50000.0,
-            status="not_started",
-            percent_complete=0.0
-        ),
-        Task(
-            id="T005",
-            name="Testing",
-            wbs_element="1.4",
-            control_account="CA003",
-            responsible_person="Lisa Tester",
-            planned_start_date=now + timedelta(days=33),
-            planned_finish_date=now + timedelta(days=48),
-            budget_at_completion=25000.0,
-            status="not_started",
-            percent_complete=0.0
-        ),
-        Task(
-            id="T006",
-            name="Deployment",
-            wbs_element="1.5",
-            control_account="CA003",
-            responsible_person="David DevOps",
-            planned_start_date=now + timedelta(days=49),
-            planned_finish_date=now + timedelta(days=55),
-            budget_at_completion=15000.0,
-            status="not_started",
-            percent_complete=0.0
-        ),
-        Task(
-            id="T007",
-            name="Documentation",
-            wbs_element="1.6",
-            control_account="CA004",
-            responsible_person="Emily Writer",
-            planned_start_date=now + timedelta(days=33),
-            planned_finish_date=now + timedelta(days=55),
-            budget_at_completion=10000.0,
-            status="not_started",
-            percent_complete=0.0
-        ),
-        Task(
-            id="T008",
-            name="Project Management",
-            wbs_element="1.7",
-            control_account="CA004",
-            responsible_person="Robert Manager",
-            planned_start_date=now - timedelta(days=30),
-            planned_finish_date=now + timedelta(days=60),
-            actual_start_date=now - timedelta(days=30),
-            budget_at_completion=30000.0,
-            status="in_progress",
-            percent_complete=0.3
+        Task.construct(
+            id=task_id,
+            name=name,
+            wbs_element=wbs_element,
+            control_account=control_account,
+            responsible_person=responsible_person,
+            planned_start_date=now + _DAY * planned_start,
+            planned_finish_date=now + _DAY * planned_finish,
+            actual_start_date=now + _DAY * actual_start if actual_start is not None else None,
+            actual_finish_date=now + _DAY * actual_finish if actual_finish is not None else None,
+            budget_at_completion=budget,
+            status=status,
+            percent_complete=percent_complete
         )
+        for (task_id, name, wbs_element, control_account, responsible_person,
+             planned_start, planned_finish, actual_start, actual_finish,
+             budget, status, percent_complete) in _SAMPLE_TASK_ROWS
     ]
     
     # Create sample project
-    project = ProjectData(
+    project = ProjectData.construct(
         id="P001",
         name="Enterprise Software Development",
         description="Development of a new enterprise resource planning (ERP) system",
-        start_date=now - timedelta(days=30),
-        planned_finish_date=now + timedelta(days=60),
+        start_date=now - _DAY * 30,
+        planned_finish_date=now + _DAY * 60,
         budget_at_completion=215000.0,
         tasks=tasks
     )
@@ -189,87 +173,121 @@ def generate_sample_data() -> ProjectData:
     return project
 
 
-def save_sample_data(file_path: Union[str, Path]):
-    """Save sample project data to a JSON file.
+# Directories already created by this process, so repeated saves skip the stat calls
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(dir_path: Path) -> None:
+    """Create a directory (and parents) unless this process already did.
     
     Args:
-        file_path: Path to save the JSON file
+        dir_path: Directory that must exist
     """
-    # Generate sample data
-    project = generate_sample_data()
+    if dir_path in _ensured_dirs:
+        return
+    dir_path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(dir_path)
+
+
+def _open_for_writing(file_path: Path):
+    """Open a file for binary writing, creating its directory if needed.
+    
+    A directory created earlier may have been removed since, so on
+    FileNotFoundError it is created again and the open retried once.
     
-    # Convert to dictionary (Pydantic models have a .dict() method)
-    project_dict = project.dict()
+    Args:
+        file_path: File to open
+        
+    Returns:
+        The open binary file
+    """
+    _ensure_dir(file_path.parent)
+    try:
+        return open(file_path, 'wb')
+    except FileNotFoundError:
+        _ensured_dirs.discard(file_path.parent)
+        _ensure_dir(file_path.parent)
+        return open(file_path, 'wb')
+
+
+@lru_cache(maxsize=1)
+def _sample_project_json(minute: datetime) -> bytes:
+    """Serialize a freshly generated sample project.
     
-    # Convert datetime objects to ISO format strings
-    _convert_dates_to_iso(project_dict)
+    Keyed by the current minute, so repeated saves within a minute reuse the
+    same bytes while the sample dates still follow the wall clock.
     
+    Args:
+        minute: Current time truncated to the minute
+        
+    Returns:
+        bytes: Indented JSON for the sample project
+    """
+    return dumps_with_dates(generate_sample_data().dict())
+
+
+def save_sample_data(file_path: Union[str, Path]):
+    """Save sample project data to a JSON file.
+    
+    Args:
+        file_path: Path to save the JSON file
+    """
     # Ensure directory exists
     if isinstance(file_path, str):
         file_path = Path(file_path)
         
-    os.makedirs(file_path.parent, exist_ok=True)
-    
     # Save to file
-    with open(file_path, 'w') as f:
-        json.dump(project_dict, f, indent=2)
+    with _open_for_writing(file_path) as f:
+        f.write(_sample_project_json(datetime.now().replace(second=0, microsecond=0)))
         
     print(f"Sample data saved to {file_path}")
 
 
+# Exact value types that can never contain a datetime
+_ISO_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 def _convert_dates_to_iso(data: Dict[str, Any]):
-    """Recursively convert datetime objects to ISO format strings in a dictionary.
+    """Convert datetime objects to ISO format strings in a nested dictionary, in place.
+    
+    Walks the structure with an explicit stack rather than recursion; dictionaries
+    nested in lists (at any depth) are converted too.
     
     Args:
         data: Dictionary to process
     """
-    for key, value in data.items():
-        if isinstance(value, datetime):
-            data[key] = value.isoformat()
-        elif isinstance(value, dict):
-            _convert_dates_to_iso(value)
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    _convert_dates_to_iso(item)
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for key, value in container.items():
+                # Most values are plain scalars; one set lookup rules them out
+                if type(value) in _ISO_LEAF_TYPES:
+                    continue
+                if isinstance(value, datetime):
+                    container[key] = value.isoformat()
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            for item in container:
+                if type(item) not in _ISO_LEAF_TYPES and isinstance(item, (dict, list)):
+                    stack.append(item)
 
 
-def generate_evm_metrics_for_task(task: Task, as_of_date: datetime) -> EVMMetrics:
-    """Generate sample EVM metrics for a task.
+def _evm_kernel(bac, pct, planned_fraction, cpi_factor):
+    """Compute sample EVM values for one task from plain floats.
     
-    Args:
-        task: The task to generate metrics for
-        as_of_date: The date to calculate metrics as of
-        
     Returns:
-        EVMMetrics: Sample EVM metrics
+        Tuple of (bcws, bcwp, acwp, cv, sv, cpi, spi, eac, etc, tcpi, vac)
     """
-    # Calculate planned values
-    if not task.planned_start_date or not task.planned_finish_date or task.budget_at_completion <= 0:
-        return None
-        
-    planned_duration = (task.planned_finish_date - task.planned_start_date).days
-    if planned_duration <= 0:
-        return None
-        
-    # Calculate BCWS (planned value)
-    if as_of_date < task.planned_start_date:
-        bcws = 0.0
-    elif as_of_date >= task.planned_finish_date:
-        bcws = task.budget_at_completion
-    else:
-        elapsed_days = (as_of_date - task.planned_start_date).days
-        bcws = (elapsed_days / planned_duration) * task.budget_at_completion
-    
-    # Calculate BCWP (earned value)
-    bcwp = task.percent_complete * task.budget_at_completion
+    # Calculate BCWS (planned value) and BCWP (earned value)
+    bcws = planned_fraction * bac
+    bcwp = pct * bac
     
-    # Calculate ACWP (actual cost) with some random variation
-    if task.percent_complete <= 0:
+    # Calculate ACWP (actual cost) with the supplied variation
+    if pct <= 0:
         acwp = 0.0
     else:
-        # Add some variation to make it interesting
-        cpi_factor = random.uniform(0.85, 1.15)
         acwp = bcwp / cpi_factor
     
     # Calculate variances
@@ -283,23 +301,66 @@ def generate_evm_metrics_for_task(task: Task, as_of_date: datetime) -> EVMMetric
     # Calculate estimate at completion (EAC) and estimate to complete (ETC)
     if cpi < 0.8:
         # Pessimistic formula
-        eac = acwp + ((task.budget_at_completion - bcwp) / (cpi * spi))
+        eac = acwp + ((bac - bcwp) / (cpi * spi))
     elif cpi > 1.2:
         # Optimistic formula
-        eac = acwp + ((task.budget_at_completion - bcwp) / cpi)
+        eac = acwp + ((bac - bcwp) / cpi)
     else:
         # Typical formula
-        eac = task.budget_at_completion / cpi
+        eac = bac / cpi
         
     etc = eac - acwp
     
     # Calculate to-complete performance index (TCPI)
-    tcpi = (task.budget_at_completion - bcwp) / (task.budget_at_completion - acwp) if acwp < task.budget_at_completion else 1.0
+    tcpi = (bac - bcwp) / (bac - acwp) if acwp < bac else 1.0
     
     # Calculate variance at completion (VAC)
-    vac = task.budget_at_completion - eac
+    vac = bac - eac
     
-    return EVMMetrics(
+    return bcws, bcwp, acwp, cv, sv, cpi, spi, eac, etc, tcpi, vac
+
+
+if HAS_NUMBA:
+    _evm_kernel = njit(cache=True)(_evm_kernel)
+
+
+def generate_evm_metrics_for_task(task: Task, as_of_date: datetime) -> EVMMetrics:
+    """Generate sample EVM metrics for a task.
+    
+    Args:
+        task: The task to generate metrics for
+        as_of_date: The date to calculate metrics as of
+        
+    Returns:
+        EVMMetrics: Sample EVM metrics
+    """
+    # Calculate planned values
+    if not task.planned_start_date or not task.planned_finish_date or task.budget_at_completion <= 0:
+        return None
+        
+    planned_duration = (task.planned_finish_date - task.planned_start_date).days
+    if planned_duration <= 0:
+        return None
+        
+    # Fraction of the budget planned to be spent by as_of_date
+    if as_of_date < task.planned_start_date:
+        planned_fraction = 0.0
+    elif as_of_date >= task.planned_finish_date:
+        planned_fraction = 1.0
+    else:
+        elapsed_days = (as_of_date - task.planned_start_date).days
+        planned_fraction = elapsed_days / planned_duration
+    
+    # Add some variation to make it interesting; only started tasks draw one,
+    # so the random sequence matches the vectorized forecast totals
+    cpi_factor = random.uniform(0.85, 1.15) if task.percent_complete > 0 else 1.0
+    
+    bcws, bcwp, acwp, cv, sv, cpi, spi, eac, etc, tcpi, vac = _evm_kernel(
+        float(task.budget_at_completion), float(task.percent_complete), planned_fraction, float(cpi_factor)
+    )
+    
+    # Every field is computed here as a plain float, so validation is skipped
+    return EVMMetrics.construct(
         task_id=task.id,
         date=as_of_date,
         bcws=bcws,
@@ -317,6 +378,114 @@ def generate_evm_metrics_for_task(task: Task, as_of_date: datetime) -> EVMMetric
     )
 
 
+def _is_aware(value: Optional[datetime]) -> bool:
+    """Whether a datetime carries a UTC offset."""
+    return value is not None and value.utcoffset() is not None
+
+
+def _as_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Express an aware datetime as naive UTC; NumPy would otherwise drop its offset."""
+    if not _is_aware(value):
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _tasks_to_soa(tasks: List[Task]) -> Dict[str, np.ndarray]:
+    """Convert a task list into column arrays for vectorized EVM calculations.
+    
+    Aware planned dates are converted to naive UTC, with their awareness kept in
+    separate columns so callers can reject naive/aware mixes as datetime math would.
+    
+    Args:
+        tasks: Tasks to convert
+        
+    Returns:
+        Dict mapping field names to arrays; missing planned dates become NaT
+    """
+    count = len(tasks)
+    return {
+        "bac": np.fromiter((task.budget_at_completion for task in tasks), dtype=np.float64, count=count),
+        "percent_complete": np.fromiter((task.percent_complete for task in tasks), dtype=np.float64, count=count),
+        "planned_start": np.array([_as_naive_utc(task.planned_start_date) for task in tasks], dtype="datetime64[us]"),
+        "planned_finish": np.array([_as_naive_utc(task.planned_finish_date) for task in tasks], dtype="datetime64[us]"),
+        "planned_start_aware": np.fromiter((_is_aware(task.planned_start_date) for task in tasks), dtype=bool, count=count),
+        "planned_finish_aware": np.fromiter((_is_aware(task.planned_finish_date) for task in tasks), dtype=bool, count=count)
+    }
+
+
+def _sum_in_order(values: np.ndarray) -> float:
+    """Add values left to right, rounding like the per-task forecast loop did.
+    
+    np.sum adds pairwise and sum() compensates from Python 3.12, so either can
+    differ in the last bit, which int() on the forecast duration can turn into
+    a one-day shift of the estimated finish date.
+    """
+    total = 0.0
+    for value in values.tolist():
+        total += value
+    return total
+
+
+def _evm_totals(tasks: List[Task], as_of_date: datetime) -> Tuple[float, float, float]:
+    """Sum sample BCWS, BCWP and ACWP across tasks in one vectorized pass.
+    
+    Applies the same rules as generate_evm_metrics_for_task without building
+    an EVMMetrics model per task, and draws the cost variation from the same
+    random module in the same order.
+    
+    Args:
+        tasks: Tasks to aggregate
+        as_of_date: The date to calculate metrics as of
+        
+    Returns:
+        Tuple of (total BCWS, total BCWP, total ACWP)
+        
+    Raises:
+        TypeError: If naive and aware datetimes are mixed, as datetime arithmetic would
+    """
+    soa = _tasks_to_soa(tasks)
+    bac = soa["bac"]
+    pct = soa["percent_complete"]
+    start = soa["planned_start"]
+    finish = soa["planned_finish"]
+    start_aware = soa["planned_start_aware"]
+    finish_aware = soa["planned_finish_aware"]
+    
+    # Skip tasks without planned dates or budget, as the per-task generator does
+    dated = ~(np.isnat(start) | np.isnat(finish)) & (bac > 0)
+    bac, pct, start, finish = bac[dated], pct[dated], start[dated], finish[dated]
+    start_aware, finish_aware = start_aware[dated], finish_aware[dated]
+    if np.any(start_aware != finish_aware):
+        raise TypeError("can't subtract offset-naive and offset-aware datetimes")
+    
+    day = np.timedelta64(1, "D")
+    planned_duration = (finish - start) // day
+    valid = planned_duration > 0
+    bac, pct, start, finish = bac[valid], pct[valid], start[valid], finish[valid]
+    planned_duration = planned_duration[valid]
+    if np.any(start_aware[valid] != _is_aware(as_of_date)):
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+    
+    # Calculate BCWS (planned value) for the before/during/after regimes
+    as_of = np.datetime64(_as_naive_utc(as_of_date), "us")
+    elapsed_days = (as_of - start) // day
+    bcws = np.where(
+        as_of < start,
+        0.0,
+        np.where(as_of >= finish, bac, elapsed_days / planned_duration * bac)
+    )
+    
+    # Calculate BCWP (earned value) and ACWP with some random variation; one
+    # random.uniform draw per started task keeps seeded runs reproducible
+    bcwp = pct * bac
+    started = pct > 0
+    cpi_factors = np.ones_like(bac)
+    cpi_factors[started] = [random.uniform(0.85, 1.15) for _ in range(int(np.count_nonzero(started)))]
+    acwp = np.where(started, bcwp / cpi_factors, 0.0)
+    
+    return _sum_in_order(bcws), _sum_in_order(bcwp), _sum_in_order(acwp)
+
+
 def generate_forecast_for_project(project: ProjectData, as_of_date: datetime) -> Forecast:
     """Generate a sample forecast for a project.
     
@@ -328,16 +497,7 @@ def generate_forecast_for_project(project: ProjectData, as_of_date: datetime) ->
         Forecast: Sample forecast
     """
     # Aggregate metrics across all tasks
-    total_bcws = 0.0
-    total_bcwp = 0.0
-    total_acwp = 0.0
-    
-    for task in project.tasks:
-        metrics = generate_evm_metrics_for_task(task, as_of_date)
-        if metrics:
-            total_bcws += metrics.bcws
-            total_bcwp += metrics.bcwp
-            total_acwp += metrics.acwp
+    total_bcws, total_bcwp, total_acwp = _evm_totals(project.tasks, as_of_date)
     
     # Calculate project-level performance indices
     project_cpi = total_bcwp / total_acwp if total_acwp > 0 else 1.0
@@ -388,7 +548,8 @@ def generate_forecast_for_project(project: ProjectData, as_of_date: datetime) ->
     variance_factor = min(1.0, max(0.5, (project_cpi + project_spi) / 2))
     probability = 0.5 + (variance_factor * 0.3)
     
-    return Forecast(
+    # All fields are computed above, so validation is skipped
+    return Forecast.construct(
         project_id=project.id,
         date=as_of_date,
         eac=eac,
@@ -406,6 +567,9 @@ def generate_sample_physical_data() -> Dict[str, Any]:
     Returns:
         Dict containing various physical project elements
     """
+    # Single reference time so every date in the sample is consistent
+    now = datetime.now()
+    
     # Generate sample environmental factors
     environmental_factors = [
         {
@@ -414,11 +578,11 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "factor_type": "weather",
             "description": "Heavy rainfall causing flooding in excavation areas",
             "severity": "high",
-            "start_date": datetime.now() - timedelta(days=2),
-            "end_date": datetime.now() + timedelta(days=1),
+            "start_date": now - _DAY * 2,
+            "end_date": now + _DAY,
             "duration_days": 3,
-            "affected_wbs_elements": ["1.3.1", "1.3.2"],
-            "affected_tasks": ["T003", "T004"],
+            "affected_wbs_elements": ("1.3.1", "1.3.2"),
+            "affected_tasks": ("T003", "T004"),
             "status": "active"
         },
         {
@@ -427,10 +591,10 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "factor_type": "site_condition",
             "description": "Unexpected rock formation requiring additional excavation equipment",
             "severity": "medium",
-            "start_date": datetime.now() - timedelta(days=1),
+            "start_date": now - _DAY,
             "duration_days": 4,
-            "affected_wbs_elements": ["1.3.1"],
-            "affected_tasks": ["T003"],
+            "affected_wbs_elements": ("1.3.1",),
+            "affected_tasks": ("T003",),
             "status": "active"
         },
         {
@@ -439,10 +603,10 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "factor_type": "regulatory",
             "description": "Additional environmental permits required for wetland area",
             "severity": "medium",
-            "start_date": datetime.now() + timedelta(days=5),
+            "start_date": now + _DAY * 5,
             "duration_days": 10,
-            "affected_wbs_elements": ["1.2.3", "1.3.4"],
-            "affected_tasks": ["T007", "T008"],
+            "affected_wbs_elements": ("1.2.3", "1.3.4"),
+            "affected_tasks": ("T007", "T008"),
             "status": "pending"
         }
     ]
@@ -454,10 +618,10 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "project_id": "P001",
             "material_name": "Structural Steel",
             "supplier_name": "Steel Supply Co.",
-            "original_delivery_date": datetime.now() + timedelta(days=3),
-            "revised_delivery_date": datetime.now() + timedelta(days=8),
+            "original_delivery_date": now + _DAY * 3,
+            "revised_delivery_date": now + _DAY * 8,
             "delay_days": 5,
-            "dependent_tasks": ["T003", "T004"],
+            "dependent_tasks": ("T003", "T004"),
             "on_critical_path": True,
             "alternatives_available": False,
             "cost_impact": 7500.0,
@@ -468,10 +632,10 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "project_id": "P001",
             "material_name": "Electrical Components",
             "supplier_name": "Electro Systems Inc.",
-            "original_delivery_date": datetime.now() + timedelta(days=5),
-            "revised_delivery_date": datetime.now() + timedelta(days=8),
+            "original_delivery_date": now + _DAY * 5,
+            "revised_delivery_date": now + _DAY * 8,
             "delay_days": 3,
-            "dependent_tasks": ["T005"],
+            "dependent_tasks": ("T005",),
             "on_critical_path": False,
             "alternatives_available": True,
             "cost_impact": 2500.0,
@@ -485,7 +649,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "observation_id": "O001",
             "project_id": "P001",
             "task_id": "T002",
-            "observation_date": datetime.now() - timedelta(days=2),
+            "observation_date": now - _DAY * 2,
             "observer": "John Smith",
             "observed_progress": 0.65,
             "reported_progress": 0.75,
@@ -496,7 +660,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             "observation_id": "O002",
             "project_id": "P001",
             "task_id": "T002",
-            "observation_date": datetime.now() - timedelta(days=1),
+            "observation_date": now - _DAY,
             "observer": "Jane Doe",
             "observed_progress": 0.60,
             "reported_progress": 0.75,
@@ -507,7 +671,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
     
     # Generate sample site conditions for risk assessment
     site_conditions = {
-        "scan_date": datetime.now(),
+        "scan_date": now,
         "project_id": "P001",
         "weather": {
             "current": {
@@ -519,7 +683,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
             },
             "forecast": [
                 {
-                    "date": datetime.now() + timedelta(days=1),
+                    "date": now + _DAY,
                     "conditions": "Thunderstorms",
                     "high_temp": 78,
                     "low_temp": 65,
@@ -527,7 +691,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                     "work_impact": "high"
                 },
                 {
-                    "date": datetime.now() + timedelta(days=2),
+                    "date": now + _DAY * 2,
                     "conditions": "Rain",
                     "high_temp": 72,
                     "low_temp": 62,
@@ -535,7 +699,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                     "work_impact": "medium"
                 },
                 {
-                    "date": datetime.now() + timedelta(days=3),
+                    "date": now + _DAY * 3,
                     "conditions": "Partly Cloudy",
                     "high_temp": 75,
                     "low_temp": 60,
@@ -547,18 +711,18 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                 {
                     "type": "Thunderstorm Warning",
                     "severity": "moderate",
-                    "issued_date": datetime.now(),
-                    "expiry_date": datetime.now() + timedelta(days=1),
+                    "issued_date": now,
+                    "expiry_date": now + _DAY,
                     "description": "Thunderstorms with potential for heavy rain, lightning, and strong winds expected in the project area."
                 }
             ]
         },
         "site_access": {
             "status": "limited",
-            "restrictions": [
+            "restrictions": (
                 "Heavy equipment access limited to north entrance only",
                 "South access road closed due to utility work"
-            ],
+            ),
             "delivery_access": "restricted"
         },
         "labor": {
@@ -600,7 +764,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                     "location": "Concrete pour area - Section A",
                     "current_reading": 76,
                     "status": "normal",
-                    "last_updated": datetime.now() - timedelta(minutes=15)
+                    "last_updated": now - _MINUTE * 15
                 },
                 {
                     "sensor_id": "TS002",
@@ -608,7 +772,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                     "current_reading": 79,
                     "status": "alert",
                     "alert_message": "Temperature exceeding optimal curing range",
-                    "last_updated": datetime.now() - timedelta(minutes=10)
+                    "last_updated": now - _MINUTE * 10
                 }
             ],
             "moisture_sensors": [
@@ -617,7 +781,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                     "location": "Foundation - North side",
                     "current_reading": 45,
                     "status": "normal",
-                    "last_updated": datetime.now() - timedelta(minutes=20)
+                    "last_updated": now - _MINUTE * 20
                 }
             ],
             "equipment_sensors": [
@@ -630,7 +794,7 @@ def generate_sample_physical_data() -> Dict[str, Any]:
                         "maintenance_status": "warning",
                         "warning_detail": "Scheduled maintenance overdue by 2 days"
                     },
-                    "last_updated": datetime.now() - timedelta(minutes=5)
+                    "last_updated": now - _MINUTE * 5
                 }
             ]
         }
@@ -675,46 +839,46 @@ def generate_sample_physical_data() -> Dict[str, Any]:
     
     # Physical vs reported progress
     physical_vs_reported = {
-        "as_of_date": datetime.now(),
+        "as_of_date": now,
         "metrics": [
             {
-                "date": datetime.now() - timedelta(days=30),
+                "date": now - _DAY * 30,
                 "physical_percent_complete": 0.1,
                 "reported_percent_complete": 0.1,
                 "variance_percentage": 0.0
             },
             {
-                "date": datetime.now() - timedelta(days=25),
+                "date": now - _DAY * 25,
                 "physical_percent_complete": 0.15,
                 "reported_percent_complete": 0.18,
                 "variance_percentage": -3.0
             },
             {
-                "date": datetime.now() - timedelta(days=20),
+                "date": now - _DAY * 20,
                 "physical_percent_complete": 0.22,
                 "reported_percent_complete": 0.27,
                 "variance_percentage": -5.0
             },
             {
-                "date": datetime.now() - timedelta(days=15),
+                "date": now - _DAY * 15,
                 "physical_percent_complete": 0.30,
                 "reported_percent_complete": 0.37,
                 "variance_percentage": -7.0
             },
             {
-                "date": datetime.now() - timedelta(days=10),
+                "date": now - _DAY * 10,
                 "physical_percent_complete": 0.42,
                 "reported_percent_complete": 0.48,
                 "variance_percentage": -6.0
             },
             {
-                "date": datetime.now() - timedelta(days=5),
+                "date": now - _DAY * 5,
                 "physical_percent_complete": 0.51,
                 "reported_percent_complete": 0.60,
                 "variance_percentage": -9.0
             },
             {
-                "date": datetime.now(),
+                "date": now,
                 "physical_percent_complete": 0.62,
                 "reported_percent_complete": 0.72,
                 "variance_percentage": -10.0
@@ -746,11 +910,35 @@ def save_sample_physical_data(file_path: Union[str, Path]) -> None:
     file_path = Path(file_path)
     data = generate_sample_physical_data()
     
-    # Convert data to serializable format
-    serializable_data = data.copy()
-    _convert_dates_to_iso(serializable_data)
-    
-    with open(file_path, 'w') as f:
-        json.dump(serializable_data, f, indent=2)
+    # Stream section by section instead of serializing the whole document at once
+    with _open_for_writing(file_path) as f:
+        f.writelines(iter_json_sections(data))
         
     print(f"Sample physical project data saved to {file_path}")
+
+
+def save_all_sample_data(dir_path: Union[str, Path], overwrite: bool = True) -> None:
+    """Save the sample project and sample physical data files into a directory.
+    
+    The files are written concurrently so their file I/O overlaps.
+    
+    Args:
+        dir_path: Directory to save sample_project.json and sample_physical_data.json in
+        overwrite: Whether to replace files that already exist
+    """
+    dir_path = Path(dir_path)
+    jobs = [
+        (save_sample_data, dir_path / "sample_project.json"),
+        (save_sample_physical_data, dir_path / "sample_physical_data.json")
+    ]
+    jobs = [(save, file_path) for save, file_path in jobs if overwrite or not file_path.exists()]
+    if not jobs:
+        return
+    
+    _ensure_dir(dir_path)
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(save, file_path) for save, file_path in jobs]
+        # Re-raise any error from either writer
+        for future in futures:
+            future.result()
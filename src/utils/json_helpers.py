@@ -1,14 +1,96 @@
 import json
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Iterator
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+if HAS_ORJSON:
+    # orjson handles datetimes natively; numpy values and non-string keys are
+    # accepted so callers don't have to pre-convert analysis results
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Payloads repeat the same few timestamps, so their ISO strings are reused. Only
+# plain naive datetimes are cached: equal aware datetimes in different zones hash
+# alike but format differently, and subclasses may override isoformat().
+_naive_isoformat = lru_cache(maxsize=1024)(datetime.isoformat)
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
     def default(self, obj: Any) -> Any:
         if isinstance(obj, datetime):
+            if type(obj) is datetime and obj.tzinfo is None:
+                return _naive_isoformat(obj)
             return obj.isoformat()
         return super().default(obj)
 
+# Datetime hook for ujson, which has no encoder classes but accepts a default callable
+_encode_datetime = DateTimeEncoder().default
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize with the fastest available encoder, indented by two spaces.
+    
+    The encoders produce equivalent JSON but not identical bytes: orjson writes
+    non-ASCII text as UTF-8 rather than escapes, and ujson spells some float
+    exponents differently from stdlib json (1e-7 vs 1e-07).
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    if HAS_UJSON:
+        return ujson.dumps(obj, indent=2, default=_encode_datetime, escape_forward_slashes=False).encode()
+    return json.dumps(obj, cls=DateTimeEncoder, indent=2).encode()
+
+def dumps_with_dates(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON bytes with datetime handling.
+    
+    Args:
+        obj: The object to serialize
+        
+    Returns:
+        JSON bytes, ready to be written to a binary file
+    """
+    return _dumps_indented(obj)
+
+def iter_json_sections(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Serialize a mapping to indented JSON bytes one top-level entry at a time.
+    
+    Yields the same document as dumps_with_dates(data), but only one section is
+    held in serialized form at a time, so large payloads can be streamed to a file.
+    
+    Args:
+        data: Mapping with string keys to serialize
+        
+    Yields:
+        Consecutive chunks of the JSON document
+    """
+    if not (HAS_ORJSON or HAS_UJSON):
+        for chunk in DateTimeEncoder(indent=2).iterencode(data):
+            yield chunk.encode()
+        return
+    
+    if not data:
+        yield b"{}"
+        return
+    
+    separator = b"{\n  "
+    for key, value in data.items():
+        # Newlines in encoder output are always structural, so shifting every line
+        # by one level nests the section exactly as a whole-document dump would
+        section = _dumps_indented(value).replace(b"\n", b"\n  ")
+        yield separator + _dumps_indented(key) + b": " + section
+        separator = b",\n  "
+    yield b"\n}"
+
 def serialize_with_dates(obj: Any) -> str:
     """Serialize an object to JSON with datetime handling.
     
@@ -18,4 +100,8 @@ def serialize_with_dates(obj: Any) -> str:
     Returns:
         JSON string representation
     """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    if HAS_UJSON:
+        return ujson.dumps(obj, indent=2, default=_encode_datetime, escape_forward_slashes=False)
     return json.dumps(obj, cls=DateTimeEncoder, indent=2)
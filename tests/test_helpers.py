@@ -0,0 +1,202 @@
+"""Regression tests for the sample data helpers and the vectorized EVM forecast."""
+
+import random
+import shutil
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.models.schemas import ProjectData, Task
+from src.utils import helpers
+
+
+AS_OF = datetime(2025, 6, 1, 12, 0)
+
+
+def _task(task_id, start, finish, bac, percent_complete):
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        wbs_element="1.1",
+        control_account="CA-1",
+        responsible_person="Planner",
+        planned_start_date=start,
+        planned_finish_date=finish,
+        budget_at_completion=bac,
+        percent_complete=percent_complete,
+    )
+
+
+def _sample_tasks(tz=None):
+    """Tasks covering every branch of the planned and earned value rules."""
+    def day(offset):
+        return (AS_OF + timedelta(days=offset)).replace(tzinfo=tz)
+    
+    return [
+        _task("future", day(5), day(40), 10000.0, 0.0),
+        _task("running", day(-10), day(20), 25000.0, 0.4),
+        _task("running-unstarted", day(-3), day(3), 8000.0, 0.0),
+        _task("finished", day(-60), day(-1), 12000.0, 1.0),
+        _task("late", day(-30), day(-2), 5000.0, 0.7),
+        _task("zero-duration", day(-1), day(-1), 3000.0, 0.5),
+        _task("zero-budget", day(-5), day(5), 0.0, 0.5),
+        _task("partial-day", day(-1) + timedelta(hours=6), day(2), 4000.0, 0.2),
+    ]
+
+
+def _baseline_totals(tasks, as_of_date):
+    """Per-task aggregation as generate_forecast_for_project did before vectorizing."""
+    total_bcws = total_bcwp = total_acwp = 0.0
+    for task in tasks:
+        if not task.planned_start_date or not task.planned_finish_date or task.budget_at_completion <= 0:
+            continue
+        planned_duration = (task.planned_finish_date - task.planned_start_date).days
+        if planned_duration <= 0:
+            continue
+        
+        if as_of_date < task.planned_start_date:
+            bcws = 0.0
+        elif as_of_date >= task.planned_finish_date:
+            bcws = task.budget_at_completion
+        else:
+            elapsed_days = (as_of_date - task.planned_start_date).days
+            bcws = (elapsed_days / planned_duration) * task.budget_at_completion
+        
+        bcwp = task.percent_complete * task.budget_at_completion
+        if task.percent_complete <= 0:
+            acwp = 0.0
+        else:
+            acwp = bcwp / random.uniform(0.85, 1.15)
+        
+        total_bcws += bcws
+        total_bcwp += bcwp
+        total_acwp += acwp
+    return total_bcws, total_bcwp, total_acwp
+
+
+@pytest.mark.parametrize("tz", [None, timezone.utc, timezone(timedelta(hours=-5))])
+def test_evm_totals_match_per_task_baseline(tz):
+    tasks = _sample_tasks(tz)
+    as_of = AS_OF.replace(tzinfo=tz)
+    
+    random.seed(1234)
+    expected = _baseline_totals(tasks, as_of)
+    random.seed(1234)
+    actual = helpers._evm_totals(tasks, as_of)
+    
+    assert actual == expected
+
+
+def test_evm_totals_match_summed_task_metrics():
+    tasks = _sample_tasks()
+    
+    random.seed(99)
+    metrics = [helpers.generate_evm_metrics_for_task(task, AS_OF) for task in tasks]
+    metrics = [m for m in metrics if m is not None]
+    expected = (
+        sum(m.bcws for m in metrics),
+        sum(m.bcwp for m in metrics),
+        sum(m.acwp for m in metrics),
+    )
+    random.seed(99)
+    
+    assert helpers._evm_totals(tasks, AS_OF) == expected
+
+
+def test_evm_totals_compare_aware_dates_across_offsets():
+    # The same instants expressed in another zone must give the same totals
+    utc_tasks = _sample_tasks(timezone.utc)
+    offset = timezone(timedelta(hours=9))
+    shifted_tasks = [
+        task.copy(update={
+            "planned_start_date": task.planned_start_date.astimezone(offset),
+            "planned_finish_date": task.planned_finish_date.astimezone(offset),
+        })
+        for task in utc_tasks
+    ]
+    as_of = AS_OF.replace(tzinfo=timezone.utc)
+    
+    random.seed(7)
+    expected = helpers._evm_totals(utc_tasks, as_of)
+    random.seed(7)
+    actual = helpers._evm_totals(shifted_tasks, as_of.astimezone(offset))
+    
+    assert actual == expected
+
+
+def test_evm_totals_reject_mixed_naive_and_aware_dates():
+    tasks = _sample_tasks()
+    
+    with pytest.raises(TypeError):
+        helpers._evm_totals(tasks, AS_OF.replace(tzinfo=timezone.utc))
+    
+    mixed = tasks[:1] + _sample_tasks(timezone.utc)[1:2]
+    with pytest.raises(TypeError):
+        helpers._evm_totals(mixed, AS_OF)
+
+
+def test_forecast_matches_per_task_baseline(monkeypatch):
+    project = ProjectData(
+        id="P1",
+        name="Office Building",
+        start_date=AS_OF - timedelta(days=60),
+        planned_finish_date=AS_OF + timedelta(days=40),
+        budget_at_completion=67000.0,
+        tasks=_sample_tasks(),
+    )
+    
+    random.seed(42)
+    forecast = helpers.generate_forecast_for_project(project, AS_OF)
+    
+    monkeypatch.setattr(helpers, "_evm_totals", _baseline_totals)
+    random.seed(42)
+    expected = helpers.generate_forecast_for_project(project, AS_OF)
+    
+    assert forecast.dict() == expected.dict()
+
+
+def test_forecast_finish_date_matches_baseline_when_spi_is_exactly_one():
+    # Per-task totals give BCWP == BCWS exactly, so the baseline keeps the full
+    # planned duration. Pairwise summation lands one ulp above, which int()
+    # truncates to one day earlier.
+    finished = [
+        (4623.07, 0.78), (88328.67, 0.56), (72906.99, 0.4), (56931.92, 0.5),
+        (24809.84, 0.38), (82244.8, 0.85), (86390.06, 0.88), (13382.23, 0.37),
+    ]
+    ahead = [
+        (74303.01, 0.34), (78935.16, 0.26), (66180.21, 0.15), (69028.54, 0.22),
+        (51154.11, 0.2), (84701.55, 0.4), (87984.53, 0.1), (46764.73, 0.7441271830287483),
+    ]
+    tasks = [
+        _task(f"done-{i}", AS_OF - timedelta(days=60), AS_OF - timedelta(days=10), bac, pct)
+        for i, (bac, pct) in enumerate(finished)
+    ] + [
+        _task(f"ahead-{i}", AS_OF + timedelta(days=10), AS_OF + timedelta(days=50), bac, pct)
+        for i, (bac, pct) in enumerate(ahead)
+    ]
+    project = ProjectData(
+        id="P2",
+        name="Parking Garage",
+        start_date=AS_OF - timedelta(days=60),
+        planned_finish_date=AS_OF + timedelta(days=180),
+        budget_at_completion=1000000.0,
+        tasks=tasks,
+    )
+    
+    random.seed(0)
+    forecast = helpers.generate_forecast_for_project(project, AS_OF)
+    
+    assert forecast.estimated_finish_date == project.planned_finish_date
+
+
+def test_sample_data_saves_recreate_a_removed_directory(tmp_path):
+    out_dir = tmp_path / "sample"
+    helpers.save_all_sample_data(out_dir)
+    
+    shutil.rmtree(out_dir)
+    helpers.save_all_sample_data(out_dir)
+    
+    assert (out_dir / "sample_project.json").exists()
+    assert (out_dir / "sample_physical_data.json").exists()
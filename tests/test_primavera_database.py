@@ -0,0 +1,87 @@
+"""Regression tests for PrimaveraDatabase transactions."""
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from src.integration.primavera_database import PrimaveraDatabase
+
+
+PROJECTS = [
+    {"proj_id": "P1", "proj_name": "Office Building"},
+    {"proj_id": "P2", "proj_name": "Parking Garage"},
+]
+
+ACTIVITIES = [
+    {"task_id": "T1", "proj_id": "P1", "task_name": "Foundation"},
+    {"task_id": "T2", "proj_id": "P2", "task_name": "Ramp"},
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = PrimaveraDatabase(tmp_path / "primavera.db")
+    yield database
+    database.disconnect()
+
+
+def _committed_count(db, table):
+    """Count rows through a separate connection, so only committed rows are seen."""
+    with sqlite3.connect(db.db_path) as other:
+        return other.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_transaction_commits_on_success(db):
+    with db.transaction():
+        db.store_projects(PROJECTS)
+        db.store_activities_bulk(ACTIVITIES)
+    
+    assert _committed_count(db, "projects") == 2
+    assert _committed_count(db, "activities") == 2
+
+
+def test_transaction_defers_commit_until_block_ends(db):
+    with db.transaction():
+        db.store_projects(PROJECTS)
+        assert _committed_count(db, "projects") == 0
+    
+    assert _committed_count(db, "projects") == 2
+
+
+def test_transaction_rolls_back_every_store_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.store_projects(PROJECTS)
+            db.store_activities_bulk(ACTIVITIES)
+            db.store_import_log(import_type="api", source="test", status="success")
+            raise RuntimeError("import failed")
+    
+    assert db.get_projects() == []
+    assert db.get_activities() == []
+    assert _committed_count(db, "import_log") == 0
+
+
+def test_store_commits_again_after_rolled_back_transaction(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.store_projects(PROJECTS)
+            raise RuntimeError("import failed")
+    
+    # Outside a block each store call commits on its own again
+    db.store_projects(PROJECTS[:1])
+    
+    assert _committed_count(db, "projects") == 1
+
+
+def test_store_activities_bulk_updates_existing_rows(db):
+    db.store_projects(PROJECTS)
+    db.store_activities_bulk(ACTIVITIES)
+    db.store_activities_bulk([{"task_id": "T1", "proj_id": "P1", "task_name": "Footings"}])
+    
+    rows = db.run_query("SELECT task_id, task_name FROM activities ORDER BY task_id")
+    assert [(row["task_id"], row["task_name"]) for row in rows] == [
+        ("T1", "Footings"),
+        ("T2", "Ramp"),
+    ]
@@ -0,0 +1,160 @@
+"""Regression tests for response cache invalidation on Primavera imports."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("fastapi_cache")
+
+import orjson
+from fastapi import HTTPException
+
+from src.integration.primavera_database import PrimaveraDatabase
+from src.user_interface import primavera_router
+
+
+class FakeConnector:
+    """Connector returning fixed Primavera data without a P6 connection."""
+    
+    def __init__(self, fail_activities=False):
+        self.connection_type = "file"
+        self.is_connected = True
+        self.fail_activities = fail_activities
+    
+    def connect(self):
+        return True
+    
+    def disconnect(self):
+        pass
+    
+    def get_projects(self):
+        return [{"proj_id": "P1", "proj_name": "Office Building"}]
+    
+    def get_activities_bulk(self, proj_ids):
+        if self.fail_activities:
+            raise RuntimeError("P6 query failed")
+        return [{"task_id": "T1", "proj_id": "P1", "task_name": "Foundation"}]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = PrimaveraDatabase(tmp_path / "primavera.db")
+    yield database
+    database.disconnect()
+
+
+@pytest.fixture
+def cleared(monkeypatch):
+    """Record every FastAPICache.clear call made by the router."""
+    calls = []
+    
+    async def fake_clear(namespace=None, key=None):
+        calls.append(namespace)
+        return 0
+    
+    monkeypatch.setattr(primavera_router.FastAPICache, "clear", fake_clear)
+    return calls
+
+
+def _import(conn, db):
+    request = primavera_router.ImportRequest(type="file", source="test")
+    return asyncio.run(primavera_router.import_primavera_data(request, conn=conn, db=db))
+
+
+def _import_statuses(db):
+    return [row["status"] for row in db.run_query("SELECT status FROM import_log")]
+
+
+def test_import_clears_primavera_response_cache(db, cleared):
+    response = _import(FakeConnector(), db)
+    
+    assert orjson.loads(response.body)["status"] == "success"
+    assert cleared == [primavera_router._CACHE_NAMESPACE]
+
+
+def test_failed_cache_clear_keeps_import_successful(db, monkeypatch, caplog):
+    async def failing_clear(namespace=None, key=None):
+        raise ConnectionError("redis unavailable")
+    
+    monkeypatch.setattr(primavera_router.FastAPICache, "clear", failing_clear)
+    
+    with caplog.at_level(logging.WARNING, logger=primavera_router.__name__):
+        response = _import(FakeConnector(), db)
+    
+    body = orjson.loads(response.body)
+    assert response.status_code == 200
+    assert body["status"] == "success"
+    assert body["project_count"] == 1
+    assert _import_statuses(db) == ["success"]
+    assert "Failed to clear Primavera response cache" in caplog.text
+
+
+def test_failed_import_leaves_cache_alone(db, cleared):
+    with pytest.raises(HTTPException) as exc_info:
+        _import(FakeConnector(fail_activities=True), db)
+    
+    assert exc_info.value.status_code == 500
+    assert cleared == []
+    assert _import_statuses(db) == ["error"]
+
+
+def test_connect_lock_follows_the_running_loop():
+    conn = FakeConnector()
+    connects = []
+    
+    def slow_connect():
+        connects.append(True)
+        time.sleep(0.01)
+        conn.is_connected = True
+    
+    conn.connect = slow_connect
+    
+    async def connect_concurrently():
+        return await asyncio.gather(
+            primavera_router._ensure_connected(conn),
+            primavera_router._ensure_connected(conn),
+        )
+    
+    # Each asyncio.run starts a new loop; a lock bound to the first one would
+    # fail in the second with "attached to a different loop"
+    for _ in range(2):
+        conn.is_connected = False
+        assert asyncio.run(connect_concurrently()) == [True, True]
+    
+    assert len(connects) == 2
+
+
+@pytest.fixture
+def client(db):
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from fastapi_cache import FastAPICache
+    
+    app = FastAPI()
+    app.include_router(primavera_router.router)
+    conn = FakeConnector()
+    app.dependency_overrides[primavera_router.get_connector] = lambda: conn
+    app.dependency_overrides[primavera_router.get_database] = lambda: db
+    
+    FastAPICache.reset()
+    primavera_router.init_response_cache()
+    yield TestClient(app)
+    FastAPICache.reset()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/primavera/status", "/api/v1/primavera/projects"])
+def test_cached_endpoints_send_cache_headers(client, path):
+    first = client.get(path)
+    second = client.get(path)
+    
+    assert first.status_code == second.status_code == 200
+    assert first.headers["Cache-Control"].startswith("max-age=")
+    assert second.headers["Cache-Control"].startswith("max-age=")
+    assert first.headers["ETag"] == second.headers["ETag"]
+    
+    revalidated = client.get(path, headers={"If-None-Match": second.headers["ETag"]})
+    assert revalidated.status_code == 304
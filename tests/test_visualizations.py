@@ -0,0 +1,150 @@
+"""Regression tests for chart data serialization and memoization."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.user_interface import visualizations
+from src.user_interface.visualizations import EVMVisualizer
+
+
+def test_to_json_matches_stdlib_fallback(monkeypatch):
+    pytest.importorskip("orjson")
+    chart = {
+        "issued": datetime(2025, 1, 1, 9, 30),
+        "updated": datetime(2025, 1, 1, 9, 30, 15, 250000, tzinfo=timezone(timedelta(hours=2))),
+        "series": np.array([1.5, 2.0]),
+        "count": np.int64(3),
+        "label": "Café",
+    }
+    visualizer = EVMVisualizer()
+    
+    with_orjson = visualizer.to_json(chart)
+    monkeypatch.setattr(visualizations, "HAS_ORJSON", False)
+    with_json = visualizer.to_json(chart)
+    
+    assert with_orjson == with_json
+    assert b'"issued":"2025-01-01T09:30:00"' in with_json
+
+
+class _Recorder:
+    """Counts calls to a memoized method."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    @visualizations._memoize_by_arguments()
+    def build(self, value):
+        self.calls += 1
+        return {"value": value, "items": [value]}
+
+
+def test_memoized_generator_reuses_equal_arguments():
+    recorder = _Recorder()
+    
+    recorder.build([{"a": 1}])
+    recorder.build([{"a": 1}])
+    
+    assert recorder.calls == 1
+
+
+@pytest.mark.parametrize("first, second", [
+    ([1, 2], (1, 2)),
+    (datetime(2025, 1, 1), "2025-01-01T00:00:00"),
+    (1, 1.0),
+    (
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+    ),
+])
+def test_memoized_generator_separates_equivalent_encodings(first, second):
+    recorder = _Recorder()
+    
+    assert recorder.build(first)["value"] == first
+    assert type(recorder.build(second)["value"]) is type(second)
+    assert recorder.calls == 2
+
+
+def test_memoized_generator_results_are_isolated_from_callers():
+    recorder = _Recorder()
+    
+    first = recorder.build("x")
+    first["items"].append("mutated")
+    first["value"] = "mutated"
+    
+    assert recorder.build("x") == {"value": "x", "items": ["x"]}
+    assert recorder.calls == 1
+
+
+def test_memoized_generator_caches_per_instance():
+    first, second = _Recorder(), _Recorder()
+    
+    first.build("x")
+    second.build("x")
+    
+    assert (first.calls, second.calls) == (1, 1)
+
+
+def test_memoized_generator_skips_unsupported_inputs():
+    recorder = _Recorder()
+    sensor = object()
+    
+    recorder.build(sensor)
+    recorder.build(sensor)
+    
+    assert recorder.calls == 2
+
+
+def test_chart_schema_parts_are_read_only():
+    chart = EVMVisualizer().generate_risk_matrix("P1", [{"likelihood": 0.2, "impact": 0.9}])
+    
+    with pytest.raises(TypeError):
+        chart["x_axis"]["title"] = "Probability"
+    with pytest.raises(AttributeError):
+        chart["zones"].append({"value": 2, "color": "#000000"})
+    
+    assert visualizations._RISK_MATRIX_X_AXIS["title"] == "Likelihood"
+
+
+def test_to_json_encodes_frozen_schema_parts(monkeypatch):
+    visualizer = EVMVisualizer()
+    chart = visualizer.generate_resource_productivity_chart(
+        "P1", [{"resource_type": "labor", "resource_name": "Crew", "productivity_index": 0.9}]
+    )
+    
+    encoded = visualizer.to_json(chart)
+    monkeypatch.setattr(visualizations, "HAS_ORJSON", False)
+    
+    assert visualizer.to_json(chart) == encoded
+    assert b'"plotLines":[{"value":1,' in encoded
+
+
+def test_chart_values_keep_their_input_types():
+    visualizer = EVMVisualizer()
+    
+    progress = visualizer.generate_physical_progress_chart("P1", [
+        {"date": datetime(2025, 1, 1), "physical_percent_complete": 0, "reported_percent_complete": 1},
+        {"date": datetime(2025, 1, 2), "physical_percent_complete": 0.5, "reported_percent_complete": 1},
+    ])
+    risks = visualizer.generate_risk_matrix("P1", [{"likelihood": 1, "impact": 0}])
+    heatmap = visualizer.generate_environmental_impact_heatmap("P1", [
+        {"factor_type": "weather", "severity": "high", "duration_days": 12, "affected_wbs_elements": ["1.1"]},
+        {"factor_type": "noise", "severity": "low", "duration_days": 2.5, "affected_wbs_elements": ["1.2"]},
+    ])
+    
+    assert progress["series"][0]["data"] == [0, 50.0]
+    assert [type(v) for v in progress["series"][0]["data"]] == [int, float]
+    assert [type(v) for v in progress["series"][1]["data"]] == [int, int]
+    point = risks["data"][0]
+    assert [type(point[k]) for k in ("x", "y", "risk_score")] == [int, int, int]
+    assert [(cell["value"], type(cell["value"])) for cell in heatmap["data"]] == [
+        (0, int), (6, int), (0.5, float), (0, int)
+    ]
+
+
+@pytest.mark.parametrize("value", [None, "0.5"])
+def test_chart_inputs_reject_non_numeric_values(value):
+    with pytest.raises(TypeError):
+        EVMVisualizer().generate_risk_matrix("P1", [{"likelihood": value, "impact": 0.5}])